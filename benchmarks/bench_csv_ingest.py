@@ -0,0 +1,65 @@
+""" Compares the chunked CSV ingest engine with the old np.genfromtxt import path.
+
+    python benchmarks/bench_csv_ingest.py --megabytes 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from csv_ingest import read_rate_csv
+
+
+def write_test_file(file_name, megabytes, sampling_rate=3500):
+    # same layout as signals_data/: rate header, then one sample per line in scientific notation
+    n_samples = int(megabytes * 1024 * 1024 / len('-1.234567E-01\n'))
+    samples = np.sin(np.arange(n_samples) * 2 * np.pi / sampling_rate) + 0.1 * np.random.randn(n_samples)
+    with open(file_name, mode='w') as file:
+        file.write(f"{sampling_rate}\n")
+        np.savetxt(file, samples, fmt='%.6E')
+    return n_samples
+
+
+def genfromtxt_path(file_name):
+    with open(file_name, mode='r') as file:
+        sampling_rate = float(file.readline().strip())
+        return np.genfromtxt(file, delimiter=','), sampling_rate
+
+
+def best_of(function, repeats):
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--megabytes', type=float, default=20, help="size of the generated CSV file")
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_name = os.path.join(directory, 'bench_signal.csv')
+        n_samples = write_test_file(file_name, args.megabytes)
+        print(f"{args.megabytes:g} MB, {n_samples} samples")
+
+        candidates = [
+            ("np.genfromtxt", lambda: genfromtxt_path(file_name)),
+            ("csv_ingest float64", lambda: read_rate_csv(file_name)),
+            ("csv_ingest float32", lambda: read_rate_csv(file_name, dtype=np.float32)),
+        ]
+        baseline = None
+        for name, function in candidates:
+            seconds = best_of(function, args.repeats)
+            baseline = baseline or seconds
+            print(f"{name:<20} {seconds:8.3f} s  {n_samples / seconds / 1e6:7.2f} M samples/s  x{baseline / seconds:.1f}")
+
+
+if __name__ == '__main__':
+    main()
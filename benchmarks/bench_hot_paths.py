@@ -0,0 +1,185 @@
+""" Headless benchmarks of the rendering and playback hot paths of SignalPlotWidget.
+
+Builds a pair of graphs with synthetic signals and times plot_signals, playback ticks
+(update_plot), on_signal_clicked, zoom_in/zoom_out, linked sync_range and file imports
+through Utils.import_signal_file. Results are written as JSON, to compare builds:
+
+    python benchmarks/bench_hot_paths.py --length 1000000 --count 4 --output bench.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+os.environ.setdefault('MSV_SIGNAL_CACHE', '0')   # time the parser, not the signal cache
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+import pyqtgraph as pg
+from PyQt5 import QtCore, QtWidgets
+
+app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+from binary_signal import write_binary_signal
+from render_scheduler import RenderScheduler
+from signal_model import Signal
+from signal_plot_widget import SignalPlotWidget
+from utils import Utils
+
+
+def synthetic_signals(count, length, rate, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(length) / rate
+    return [Signal(np.sin(2 * np.pi * (1 + i) * t) + 0.1 * rng.standard_normal(length),
+                   color=Utils.generate_random_light_color(), title=f"synthetic {i + 1}", f_sample=rate)
+            for i in range(count)]
+
+
+def settle():
+    # run the scheduled redraws now, so they are part of the measured time
+    RenderScheduler.instance().flush()
+    app.processEvents()
+
+
+def measure(function, repeats):
+    """ Calls function() `repeats` times, each followed by the redraws it scheduled. """
+    times = []
+    for index in range(repeats):
+        start = time.perf_counter()
+        function(index)
+        settle()
+        times.append((time.perf_counter() - start) * 1000)
+    return {'runs': repeats, 'ms_median': statistics.median(times), 'ms_mean': statistics.fmean(times),
+            'ms_min': min(times), 'ms_max': max(times)}
+
+
+class ClickEvent():
+    # stands in for the scene's mouse click event
+    def __init__(self, scene_position):
+        self.position = scene_position
+
+    def scenePos(self):
+        return self.position
+
+
+def build_graphs(arguments):
+    SignalPlotWidget.graph_instances = []
+    SignalPlotWidget.is_linked = False
+    SignalPlotWidget.user_interacting = False
+    first = SignalPlotWidget(synthetic_signals(arguments.count, arguments.length, arguments.rate), name='Graph One')
+    second = SignalPlotWidget(synthetic_signals(arguments.count, arguments.length, arguments.rate, seed=1),
+                              name='Graph Two')
+
+    window = QtWidgets.QWidget()
+    layout = QtWidgets.QVBoxLayout(window)
+    for graph in (first, second):
+        layout.addLayout(graph.graph_layout)
+        layout.addLayout(graph.button_layout)
+    window.resize(1200, 900)
+    window.show()
+    app.processEvents()
+    return window, first, second
+
+
+def bench_import(graph, file_name, repeats):
+    def import_once(_):
+        finished = QtCore.QEventLoop()
+        importer = Utils.import_signal_file(graph, [file_name])
+        importer.done.connect(finished.quit)
+        finished.exec_()
+        graph.signals.pop()   # keep the graph the same size for the next run
+        graph.update_graph()
+    return measure(import_once, repeats)
+
+
+def run(arguments):
+    window, first, second = build_graphs(arguments)
+    results = {}
+    repeats = arguments.repeats
+
+    results['plot_signals'] = measure(lambda _: first.plot_signals(), repeats)
+
+    # playback: one tick per frame of the wall clock, with the window following the clock
+    first.is_playing = True
+    SignalPlotWidget.user_interacting = True
+    first.window_start, first.window_end = 0, int(arguments.rate * 10)
+    frame = first.clock.frame_interval / 1000
+    results['update_plot'] = measure(lambda index: first.update_plot(index * frame), arguments.ticks)
+    first.is_playing = False
+    SignalPlotWidget.user_interacting = False
+    first.plot_widget.enableAutoRange()
+    settle()
+
+    view_box = first.plot_widget.plotItem.vb
+    x_range, y_range = view_box.viewRange()
+    rng = np.random.default_rng(2)
+
+    def click(_):
+        point = QtCore.QPointF(rng.uniform(*x_range), rng.uniform(*y_range))
+        first.on_signal_clicked(ClickEvent(view_box.mapViewToScene(point)))
+    results['on_signal_clicked'] = measure(click, repeats)
+
+    results['zoom_in_out'] = measure(lambda index: first.zoom_in() if index % 2 == 0 else first.zoom_out(), repeats)
+
+    # linked graphs: every range change of the first graph is mirrored onto the second
+    SignalPlotWidget.is_linked = True
+    second.use_clock(first.clock)
+    first.link_viewports()
+
+    def pan(index):
+        start = (index % 10) * arguments.length / arguments.rate / 20
+        first.plot_widget.setXRange(start, start + arguments.length / arguments.rate / 10, padding=0)
+    results['linked_sync_range'] = measure(pan, repeats)
+    first.unlink_viewports()
+    second.use_clock(second.own_clock)
+    SignalPlotWidget.is_linked = False
+
+    with tempfile.TemporaryDirectory() as directory:
+        samples = np.sin(np.arange(arguments.length) / arguments.rate)
+        csv_file = os.path.join(directory, 'bench.csv')
+        with open(csv_file, mode='w') as file:
+            file.write(f"{arguments.rate}\n")
+            np.savetxt(file, samples, fmt='%.6E')
+        bin_file = os.path.join(directory, 'bench.bin')
+        write_binary_signal(bin_file, samples, arguments.rate)
+
+        results['import_csv'] = bench_import(first, csv_file, max(repeats // 4, 1))
+        results['import_bin'] = bench_import(first, bin_file, max(repeats // 4, 1))
+
+    window.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--length', type=int, default=1_000_000, help="samples per signal")
+    parser.add_argument('--count', type=int, default=2, help="signals per graph")
+    parser.add_argument('--rate', type=float, default=1000, help="sampling rate of the synthetic signals")
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--ticks', type=int, default=300, help="playback ticks timed")
+    parser.add_argument('--output', help="JSON file to write (default: print to stdout)")
+    arguments = parser.parse_args()
+
+    report = {
+        'benchmark': 'hot_paths',
+        'config': vars(arguments),
+        'environment': {'python': platform.python_version(), 'numpy': np.__version__,
+                        'pyqtgraph': pg.__version__, 'platform': platform.platform(),
+                        'qt_platform': os.environ['QT_QPA_PLATFORM']},
+        'results': run(arguments),
+    }
+    text = json.dumps(report, indent=2)
+    if arguments.output:
+        with open(arguments.output, mode='w') as file:
+            file.write(text + '\n')
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+""" Measures cold-start time of the viewer: from a fresh interpreter to the main window
+being shown, plus the cost of opening the Polar and Real-Time tabs the first time.
+
+    python benchmarks/bench_startup.py --repeats 5
+    python benchmarks/bench_startup.py --importtime     # slowest imports of one start
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# runs in a fresh interpreter each time, so nothing is already imported
+STARTUP_SCRIPT = r"""
+import os, sys, time
+start = time.perf_counter()
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.getcwd())
+from PyQt5 import QtWidgets
+app = QtWidgets.QApplication([])
+import main
+imported = time.perf_counter()
+window = main.SignalApp()
+window.resize(900, 700)
+window.show()
+app.processEvents()
+shown = time.perf_counter()
+for index in (1, 2):
+    window.tab_widget.setCurrentIndex(index)
+    app.processEvents()
+    if index == 1:
+        polar = time.perf_counter()
+realtime = time.perf_counter()
+print(imported - start, shown - start, polar - shown, realtime - polar)
+window.close()
+"""
+
+
+def run_once(extra_args=()):
+    output = subprocess.run([sys.executable, *extra_args, '-c', STARTUP_SCRIPT], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return [float(value) for value in output.stdout.split()], output.stderr
+
+
+def slowest_imports(count=15):
+    # python -X importtime writes "import time: self | cumulative | module" lines to stderr
+    _, stderr = run_once(('-X', 'importtime'))
+    timings = []
+    for line in stderr.splitlines():
+        if line.startswith('import time:') and '|' in line:
+            _, cumulative, module = line[len('import time:'):].split('|')
+            if cumulative.strip().isdigit():
+                timings.append((int(cumulative), module.rstrip()))
+    for cumulative, module in sorted(timings, reverse=True)[:count]:
+        print(f"{cumulative / 1000:9.1f} ms  {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument('--importtime', action='store_true', help="list the slowest imports of one start")
+    arguments = parser.parse_args()
+
+    if arguments.importtime:
+        slowest_imports()
+        return
+
+    run_once()   # warm the OS file cache, as on a terminal that was used before
+    runs = sorted((run_once()[0] for _ in range(arguments.repeats)), key=lambda run: run[1])
+    median = runs[len(runs) // 2]
+    print(f"imports          {median[0] * 1000:8.1f} ms")
+    print(f"window shown     {median[1] * 1000:8.1f} ms   (median of {arguments.repeats})")
+    print(f"open Polar tab   {median[2] * 1000:8.1f} ms")
+    print(f"open Real-Time   {median[3] * 1000:8.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+import json
+import os
+import struct
+import numpy as np
+
+# self-describing .bin layout: fixed 64 byte header followed by interleaved samples
+# header = magic, dtype string (numpy notation, e.g. '<f4'), channel count, sampling rate
+MAGIC = b'MSVSIG01'
+HEADER = struct.Struct('<8s8sId')
+HEADER_SIZE = 64
+
+# headerless files fall back to a "<file>.json" sidecar, or to float32 mono at 1 Hz
+DEFAULT_DTYPE = '<f4'
+DEFAULT_SAMPLING_RATE = 1
+
+
+def read_header(file_name):
+    """ Returns (dtype, channels, f_sample, data_offset) describing a binary recording. """
+    with open(file_name, 'rb') as file:
+        raw = file.read(HEADER.size)
+    if len(raw) == HEADER.size and raw[:len(MAGIC)] == MAGIC:
+        _, dtype, channels, f_sample = HEADER.unpack(raw)
+        return np.dtype(dtype.rstrip(b'\x00').decode('ascii')), channels, f_sample, HEADER_SIZE
+
+    sidecar = file_name + '.json'
+    if os.path.exists(sidecar):
+        with open(sidecar, mode='r') as file:
+            meta = json.load(file)
+        return (np.dtype(meta.get('dtype', DEFAULT_DTYPE)), int(meta.get('channels', 1)),
+                float(meta.get('f_sample', DEFAULT_SAMPLING_RATE)), int(meta.get('offset', 0)))
+
+    return np.dtype(DEFAULT_DTYPE), 1, DEFAULT_SAMPLING_RATE, 0
+
+
+def open_binary_signal(file_name):
+    """ Maps a binary recording without reading it; returns (data, f_sample).
+    data is a read-only np.memmap of shape (n,) or (n, channels). """
+    dtype, channels, f_sample, offset = read_header(file_name)
+    if channels <= 0:
+        raise ValueError(f"{os.path.basename(file_name)} declares no channels.")
+    frame_size = dtype.itemsize * channels
+    n_samples = (os.path.getsize(file_name) - offset) // frame_size
+    shape = (n_samples,) if channels == 1 else (n_samples, channels)
+    if n_samples <= 0:
+        # nothing to map yet (a recording that has just been started)
+        return np.empty((0,) + shape[1:], dtype=dtype), f_sample
+
+    data = np.memmap(file_name, dtype=dtype, mode='r', offset=offset, shape=shape)
+    return data, f_sample
+
+
+def write_header(file, dtype, channels, f_sample):
+    """ Writes the header of a binary recording; the samples follow it, row after row. """
+    header = HEADER.pack(MAGIC, np.dtype(dtype).str.encode('ascii'), channels, float(f_sample))
+    file.write(header.ljust(HEADER_SIZE, b'\x00'))
+
+
+def write_binary_signal(file_name, data, f_sample, dtype=DEFAULT_DTYPE):
+    """ Writes samples (n,) or (n, channels) to a self-describing binary recording. """
+    data = np.asarray(data, dtype=dtype)
+    channels = 1 if data.ndim == 1 else data.shape[1]
+    with open(file_name, 'wb') as file:
+        write_header(file, dtype, channels, f_sample)
+        data.tofile(file)
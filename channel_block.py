@@ -0,0 +1,77 @@
+import numpy as np
+from signal_model import Signal, TimeAxis
+from sample_buffer import SampleBuffer
+from signal_statistics import SignalStatistics
+
+
+class ChannelBlock():
+    """ Columnar store for a multi-channel recording (e.g. a multi-lead ECG).
+    All channels live in one 2-D array of shape (n_channels, n_samples), share one
+    time base and sampling rate, and each channel Signal is a view of its row. """
+
+    def __init__(self, data, f_sample, title='signal'):
+        data = np.asarray(data) if not isinstance(data, np.memmap) else data
+        if isinstance(data, np.memmap):
+            # keep the file mapping: channel rows become strided views, nothing is copied
+            self.data = data.T
+        else:
+            # one copy into channel-major order, so every channel is contiguous
+            self.data = np.ascontiguousarray(data.T)
+        self.f_sample = f_sample
+        self.title = title
+        self.time_axis = TimeAxis(0, f_sample, self.data.shape[1])
+        self._statistics = None
+        self.signals = []
+        self.source = None
+        self.buffer = None
+        self.retention = None   # seconds kept once appending (None keeps everything)
+
+    @property
+    def n_channels(self):
+        return self.data.shape[0]
+
+    def channel(self, index):
+        return self.data[index]
+
+    def create_signals(self, colors):
+        """ One Signal per channel, all viewing this block's array and time base. """
+        signals = []
+        for index, color in zip(range(self.n_channels), colors):
+            signal = Signal(self.channel(index), color=color, title=f"{self.title} ch{index + 1}",
+                            f_sample=self.f_sample)
+            signal.time_axis = self.time_axis
+            signal.block, signal.channel = self, index
+            signals.append(signal)
+        self.signals = signals
+        return signals
+
+    def grow(self, data, shifted=False):
+        """ Replaces the data with a longer channel-major (n_channels, n) version of itself. """
+        if shifted:
+            self._statistics = None
+        elif self._statistics is not None:
+            self._statistics.update(data[:, self.time_axis.n:])
+        self.data = data
+        self.time_axis.n = data.shape[1]
+        for signal in self.signals:
+            signal.grow(data[signal.channel], shifted)
+
+    def append(self, rows):
+        """ Appends row-major (k, n_channels) samples; the first call copies the block
+        into a growable channel-major buffer (a ring buffer if `retention` is set). """
+        if self.buffer is None:
+            retention = None if self.retention is None else self.retention * self.f_sample
+            self.buffer = SampleBuffer.from_data(self.data, self.n_channels, retention)
+            dropped = 0
+        else:
+            dropped = self.buffer.dropped
+        self.buffer.extend(rows)
+        self.time_axis.t0 += (self.buffer.dropped - dropped) / self.f_sample
+        self.grow(self.buffer.view(), shifted=self.buffer.dropped != dropped)
+
+    def statistics(self):
+        """ SignalStatistics of every channel, computed for all channels in one pass and
+        updated with only the new samples as the block grows. """
+        if self._statistics is None:
+            self._statistics = SignalStatistics.of(self.data)
+        return self._statistics
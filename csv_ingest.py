@@ -0,0 +1,98 @@
+import os
+import re
+import warnings
+import numpy as np
+from signal_importer import ImportCancelled
+
+# bytes parsed per chunk; big enough for the C parser to dominate, small enough for
+# smooth progress reporting and a bounded text buffer
+CHUNK_BYTES = 8 * 1024 * 1024
+
+
+# an empty field: nothing but blanks between a comma and the line start, the line end or another comma
+EMPTY_FIELD = re.compile(r'(?:(?<=,)|^)[ \t]*(?=,)|(?<=,)[ \t]*(?=\r?$)', re.MULTILINE)
+
+
+def check_rows(text, n_columns, first_line=1):
+    """ Returns the number of non-blank lines; raises ValueError at the first one without
+    exactly n_columns fields. Fields are counted for all lines at once from the positions
+    of commas and newlines. """
+    raw = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    line_ends = np.flatnonzero(raw == ord('\n'))
+    if not len(raw) or raw[-1] != ord('\n'):
+        line_ends = np.append(line_ends, len(raw))
+    commas = np.searchsorted(np.flatnonzero(raw == ord(',')), line_ends)
+    fields = np.diff(commas, prepend=0) + 1
+    n_blank = 0
+    for index in np.flatnonzero(fields != n_columns):
+        start = line_ends[index - 1] + 1 if index else 0
+        if text[start:line_ends[index]].strip():
+            raise ValueError(f"Line {first_line + index} has {fields[index]} fields instead of {n_columns}.")
+        n_blank += 1   # blank lines are skipped, as by the parser
+    return len(line_ends) - n_blank
+
+
+def parse_numbers(text, dtype):
+    with warnings.catch_warnings():
+        # NumPy 1.x only warns (DeprecationWarning) when it stops at unparsable text, 2.x raises
+        warnings.simplefilter('error', DeprecationWarning)
+        try:
+            return np.fromstring(text, dtype=dtype, sep=' ')
+        except (DeprecationWarning, ValueError):
+            raise ValueError("Malformed numeric data in CSV file.")
+
+
+def parse_values(text, dtype, n_columns=1, first_line=1):
+    """ Parses newline (and, for several columns, comma) separated numbers with NumPy's
+    C text parser; empty fields become NaN. Raises ValueError on anything that is not a
+    number, and on rows that do not have n_columns fields (first_line numbers the rows
+    in the message). """
+    if n_columns == 1:
+        return parse_numbers(text, dtype)
+    n_rows = check_rows(text, n_columns, first_line)
+    values = parse_numbers(text.replace(',', ' '), dtype)
+    if len(values) != n_rows * n_columns:
+        # empty fields vanished between the separators: parse again with NaN in their place
+        values = parse_numbers(EMPTY_FIELD.sub('nan', text).replace(',', ' '), dtype)
+    return values.reshape(-1, n_columns)
+
+
+def read_rate_csv(file_name, dtype=np.float64, progress=None, is_cancelled=None, chunk_bytes=CHUNK_BYTES):
+    """ Reads the "sampling rate on line 1, then one sample per line" CSV format.
+    Returns (data, sampling_rate); data is 1-D, or (n, columns) for comma separated rows. """
+    total_bytes = max(os.path.getsize(file_name), 1)
+    chunks = []
+    n_columns = None
+    remainder = b''
+    line = 2   # number of the first line of the next chunk
+
+    with open(file_name, mode='rb') as file:
+        sampling_rate = float(file.readline().strip())
+        while True:
+            if is_cancelled is not None and is_cancelled():
+                raise ImportCancelled()
+            block = file.read(chunk_bytes)
+            at_end = not block
+            text = remainder + block
+            if not at_end:
+                # keep the trailing partial line for the next chunk
+                cut = text.rfind(b'\n') + 1
+                text, remainder = text[:cut], text[cut:]
+            if text.strip():
+                text = text.decode('ascii')
+                if n_columns is None:
+                    first_line = text.lstrip().split('\n', 1)[0]
+                    n_columns = first_line.count(',') + 1
+                try:
+                    chunks.append(parse_values(text, dtype, n_columns, line))
+                except ValueError as e:
+                    raise ValueError(f"{os.path.basename(file_name)}: {e}")
+                line += text.count('\n')
+            if progress is not None:
+                progress(min(100 * file.tell() // total_bytes, 100))
+            if at_end:
+                break
+
+    if not chunks:
+        return np.empty(0, dtype=dtype), sampling_rate
+    return np.concatenate(chunks), sampling_rate
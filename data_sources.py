@@ -0,0 +1,181 @@
+import abc
+import csv
+import threading
+import time
+import numpy as np
+from PyQt5 import QtCore
+
+
+class DataSourceMeta(type(QtCore.QObject), abc.ABCMeta):
+    # lets a QObject subclass declare abstract methods
+    pass
+
+
+class DataSource(QtCore.QObject, metaclass=DataSourceMeta):
+    """ A live source of timestamped samples, polled on its own background thread.
+    Rows of (time in ms since epoch, value per channel) are pushed to the GUI thread in
+    batches through `samples`; `poll()` can also be called directly to pull them.
+    Subclasses implement poll(), and open()/close() for anything slow to set up.
+    A source runs at most one poller at a time: it cannot be restarted until the
+    previous poller has really exited (e.g. a blocked webdriver call returned). """
+
+    samples = QtCore.pyqtSignal(object)   # np array of shape (n, 1 + channels)
+    failed = QtCore.pyqtSignal(str)
+
+    name = 'source'
+    channel_names = ()
+    interval = 0.5   # seconds between two polls
+
+    def __init__(self):
+        super().__init__()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def start(self):
+        if self.thread is not None and self.thread.is_alive():
+            if not self.stop_event.is_set():
+                return self   # already running
+            raise RuntimeError(f"The {self.name} source is still stopping, try again in a moment.")
+        # a new event per run: setting it only ever stops the poller it was created for
+        self.stop_event = threading.Event()
+        self.thread = threading.Thread(target=self.run, args=(self.stop_event,),
+                                       name=f"{self.name}-source", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None and self.thread is not threading.current_thread():
+            self.thread.join(timeout=2)
+        if self.thread is not None and not self.thread.is_alive():
+            self.thread = None
+
+    def is_running(self):
+        # false as soon as a stop was requested, even while the poller is still exiting
+        return self.thread is not None and self.thread.is_alive() and not self.stop_event.is_set()
+
+    @property
+    def f_sample(self):
+        # nominal samples per second, e.g. for recordings
+        return 1 / self.interval
+
+    def open(self):
+        pass
+
+    @abc.abstractmethod
+    def poll(self):
+        """ Returns the rows that became available since the last poll, or None. """
+
+    def close(self):
+        pass
+
+    def run(self, stop_event):
+        try:
+            self.open()
+            while not stop_event.is_set():
+                rows = self.poll()
+                if rows is not None and len(rows) and not stop_event.is_set():
+                    self.samples.emit(rows)
+                stop_event.wait(self.interval)
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            self.close()
+
+
+class ReplaySource(DataSource):
+    """ Replays a recorded (Timestamp, Latitude, Longitude) CSV, e.g. iss_location_data.csv,
+    as if it were live, at `rate` rows per second; loops at the end of the file.
+    Works offline and, at high rates, doubles as a load test for the Real-Time tab. """
+
+    name = 'replay'
+    channel_names = ('Latitude', 'Longitude')
+    interval = 0.05
+
+    def __init__(self, file_name='iss_location_data.csv', rate=2.0):
+        super().__init__()
+        self.file_name = file_name
+        self.rate = rate
+        self.values = None
+        self.position = 0
+        self.sent = 0
+
+    @property
+    def f_sample(self):
+        return self.rate
+
+    def open(self):
+        with open(self.file_name, mode='r', newline='') as file:
+            reader = csv.reader(file)
+            next(reader)   # header
+            self.values = np.array([[float(value) for value in row[1:]] for row in reader if row])
+        if not len(self.values):
+            raise ValueError(f"{self.file_name} has no samples to replay.")
+        self.start_time = time.time()
+        self.sent = 0
+
+    def poll(self):
+        now = time.time()
+        due = int((now - self.start_time) * self.rate) - self.sent
+        if due <= 0:
+            return None
+        indices = (self.position + np.arange(due)) % len(self.values)
+        self.position = (self.position + due) % len(self.values)
+        self.sent += due
+
+        # evenly spaced timestamps ending now
+        times = now * 1000 - (due - 1 - np.arange(due)) * (1000 / self.rate)
+        return np.column_stack((times, self.values[indices]))
+
+
+class SeleniumSource(DataSource):
+    """ Live ISS position scraped from orbtrack.org with headless Chrome.
+    Selenium and webdriver_manager are only imported when the source is opened,
+    on the source's thread, so they are optional and never block the GUI. """
+
+    name = 'orbtrack'
+    channel_names = ('Latitude', 'Longitude')
+    interval = 0.5
+    url = 'https://www.orbtrack.org/#/?satName=ISS%20(ZARYA)'
+
+    def __init__(self):
+        super().__init__()
+        self.driver = None
+
+    def open(self):
+        try:
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.chrome.service import Service
+            from webdriver_manager.chrome import ChromeDriverManager
+        except ImportError:
+            raise RuntimeError("The live source needs selenium and webdriver_manager installed.")
+
+        options = Options()
+        options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        # overcome limited resource problems
+        options.add_argument("--disable-dev-shm-usage")
+        self.driver = webdriver.Chrome(service=Service(
+            ChromeDriverManager().install()), options=options)  # init chrome driver
+        self.driver.get(SeleniumSource.url)
+
+    def poll(self):
+        from selenium.webdriver.common.by import By
+        latitude = self.driver.find_element(By.ID, 'satLat').text
+        longitude = self.driver.find_element(By.ID, 'satLon').text
+        try:
+            return np.array([[time.time() * 1000, self.parse(latitude), self.parse(longitude)]])
+        except ValueError:
+            return None   # page not populated yet
+
+    @staticmethod
+    def parse(text):
+        #clean and convert strings to floats
+        text = text.replace('°', '').strip()
+        return 0.0 if text == '.' else float(text.replace(',', '.'))
+
+    def close(self):
+        if self.driver is not None:
+            self.driver.quit()
+            self.driver = None
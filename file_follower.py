@@ -0,0 +1,137 @@
+import os
+import numpy as np
+from PyQt5 import QtCore
+from binary_signal import read_header, open_binary_signal
+from csv_ingest import parse_values
+
+
+# bytes str.strip() removes: lines made only of these are skipped by the parser
+WHITESPACE = np.frombuffer(b' \t\n\r\x0b\x0c', dtype=np.uint8)
+
+
+def line_offset(file_name, lines, chunk_bytes=1024 * 1024):
+    """ Byte offset just past the first `lines` non-blank lines of a file, or None if it has
+    fewer. Blank lines hold no samples, so they are not counted. """
+    if lines == 0:
+        return 0
+    offset = 0
+    filled = False   # whether the line running into the next block has anything on it yet
+    with open(file_name, mode='rb') as file:
+        while True:
+            block = file.read(chunk_bytes)
+            if not block:
+                return None
+            raw = np.frombuffer(block, dtype=np.uint8)
+            ends = np.flatnonzero(raw == ord('\n'))
+            # non-blank bytes up to each newline: a line is non-blank if the count grew across it
+            content = np.cumsum(~np.isin(raw, WHITESPACE))
+            at_ends = content[ends]
+            non_blank = np.diff(at_ends, prepend=0) > 0
+            if len(ends):
+                non_blank[0] |= filled
+                counted = np.cumsum(non_blank)
+                if counted[-1] >= lines:
+                    return offset + int(ends[np.searchsorted(counted, lines)]) + 1
+                lines -= int(counted[-1])
+                filled = content[-1] > at_ends[-1]
+            else:
+                filled = filled or content[-1] > 0
+            offset += len(block)
+
+
+class FileFollower(QtCore.QObject):
+    """ "tail -f" for a signal whose recording is still being written.
+    Polls the file and reads only the bytes appended since the last poll: .bin recordings
+    are re-mapped with their new length, text recordings have the new lines parsed and
+    appended to the target's growable buffer. The target is a Signal or a ChannelBlock. """
+
+    grown = QtCore.pyqtSignal(int)     # number of new samples
+    failed = QtCore.pyqtSignal(str)
+
+    poll_interval = 100   # ms
+
+    def __init__(self, target, file_name):
+        super().__init__()
+        self.target = target
+        self.file_name = file_name
+        self.binary = os.path.splitext(file_name)[1].lower() == '.bin'
+        self.n_columns = getattr(target, 'n_channels', 1)
+
+        if self.binary:
+            self.dtype, _, _, self.data_offset = read_header(file_name)
+        else:
+            # skip the header line (sampling rate) of .csv files and the rows already loaded, by
+            # counting non-blank lines, as blank ones were skipped when the file was parsed
+            header_lines = 1 if file_name.lower().endswith('.csv') else 0
+            self.offset = line_offset(file_name, header_lines + len(target.time_axis))
+            # a last line without a newline was already parsed: drop it once it is completed
+            self.skip_line = self.offset is None
+            if self.offset is None:
+                self.offset = os.path.getsize(file_name)
+            self.remainder = b''
+
+        self.timer = QtCore.QTimer()
+        self.timer.timeout.connect(self.poll)
+
+    def start(self):
+        self.timer.start(FileFollower.poll_interval)
+
+    def stop(self):
+        self.timer.stop()
+
+    def is_running(self):
+        return self.timer.isActive()
+
+    def poll(self):
+        try:
+            n_new = self.read_binary() if self.binary else self.read_text()
+        except (OSError, ValueError) as e:
+            self.stop()
+            self.failed.emit(str(e))
+            return
+        if n_new:
+            self.grown.emit(n_new)
+
+    def read_binary(self):
+        frame_size = self.dtype.itemsize * self.n_columns
+        n_known = len(self.target.time_axis)
+        n_samples = (os.path.getsize(self.file_name) - self.data_offset) // frame_size
+        if n_samples <= n_known:
+            return 0
+
+        if isinstance(self.target.data, np.memmap):
+            # a longer mapping of the same file: nothing is copied
+            data, _ = open_binary_signal(self.file_name)
+            self.target.grow(data if data.ndim == 1 else data.T)
+        else:
+            with open(self.file_name, mode='rb') as file:
+                file.seek(self.data_offset + n_known * frame_size)
+                raw = file.read((n_samples - n_known) * frame_size)
+            samples = np.frombuffer(raw, dtype=self.dtype)
+            self.target.append(samples if self.n_columns == 1 else samples.reshape(-1, self.n_columns))
+        return n_samples - n_known
+
+    def read_text(self):
+        with open(self.file_name, mode='rb') as file:
+            file.seek(self.offset)
+            block = file.read()
+        if not block:
+            return 0
+        self.offset += len(block)
+
+        text = self.remainder + block
+        if self.skip_line:
+            if b'\n' not in text:
+                self.remainder = b''
+                return 0
+            text = text[text.index(b'\n') + 1:]
+            self.skip_line = False
+        # a partially written last line waits for the next poll
+        cut = text.rfind(b'\n') + 1
+        text, self.remainder = text[:cut], text[cut:]
+        if not text.strip():
+            return 0
+
+        samples = parse_values(text.decode('ascii'), self.target.data.dtype, self.n_columns)
+        self.target.append(samples)
+        return len(samples)
@@ -0,0 +1,153 @@
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+import numpy as np
+
+# off unless MSV_INSTRUMENT=1: decorated functions are then left untouched and the
+# other helpers return right away, so the hot paths pay (almost) nothing
+ENABLED = os.environ.get('MSV_INSTRUMENT', '0') != '0'
+# on-screen FPS/frame-time text on each graph (implies ENABLED)
+OVERLAY = os.environ.get('MSV_FPS_OVERLAY', '0') != '0'
+ENABLED = ENABLED or OVERLAY
+# where the timings are written when the app exits (and on F12)
+DUMP_FILE = os.environ.get('MSV_INSTRUMENT_FILE', 'instrumentation.json')
+
+
+class RollingHistogram():
+    """ The last `capacity` durations of one timer, in a fixed-size ring. """
+
+    # upper bounds of the histogram buckets, ms (a frame at 60 fps is 16.7 ms)
+    BUCKETS_MS = (1, 2, 4, 8, 16.7, 33.3, 50, 100, 250, 500, 1000, float('inf'))
+
+    def __init__(self, capacity=2000):
+        self.samples = np.zeros(capacity)
+        self.count = 0    # total recorded, including those overwritten
+
+    def add(self, duration_ms):
+        self.samples[self.count % len(self.samples)] = duration_ms
+        self.count += 1
+
+    def values(self):
+        return self.samples[:min(self.count, len(self.samples))]
+
+    def summary(self):
+        values = self.values()
+        if not len(values):
+            return {'count': 0}
+        counts = np.histogram(values, bins=(0,) + RollingHistogram.BUCKETS_MS)[0]
+        p50, p95, p99 = np.percentile(values, (50, 95, 99))
+        return {'count': self.count, 'window': len(values), 'ms_mean': float(values.mean()),
+                'ms_p50': float(p50), 'ms_p95': float(p95), 'ms_p99': float(p99), 'ms_max': float(values.max()),
+                'histogram_ms': {f"<={bound}": int(n) for bound, n in zip(RollingHistogram.BUCKETS_MS, counts)}}
+
+
+class Metrics():
+    # timers and counters of the whole app; updated from worker threads too (imports)
+    lock = threading.Lock()
+    timers = {}      # name -> RollingHistogram
+    counters = {}    # name -> int
+
+
+def record(name, seconds):
+    with Metrics.lock:
+        if name not in Metrics.timers:
+            Metrics.timers[name] = RollingHistogram()
+        Metrics.timers[name].add(seconds * 1000)
+
+
+def count(name, n=1):
+    if ENABLED:
+        with Metrics.lock:
+            Metrics.counters[name] = Metrics.counters.get(name, 0) + n
+
+
+def start():
+    # for spans that do not fit a function call, e.g. an import finishing later
+    return time.perf_counter() if ENABLED else None
+
+
+def stop(name, started):
+    if started is not None:
+        record(name, time.perf_counter() - started)
+
+
+def timed(name):
+    """ Decorator recording the duration of every call under `name` (when ENABLED). """
+    def decorate(function):
+        if not ENABLED:
+            return function
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, time.perf_counter() - started)
+        return wrapper
+    return decorate
+
+
+def snapshot():
+    with Metrics.lock:
+        return {'timers': {name: histogram.summary() for name, histogram in sorted(Metrics.timers.items())},
+                'counters': dict(sorted(Metrics.counters.items()))}
+
+
+def dump(file_name=None):
+    """ Writes the timers (rolling histograms and percentiles) and counters as JSON. """
+    if not ENABLED:
+        return None
+    file_name = file_name or DUMP_FILE
+    report = {'time': time.strftime('%Y-%m-%d %H:%M:%S'), **snapshot()}
+    with open(file_name, mode='w') as file:
+        json.dump(report, file, indent=2)
+    return file_name
+
+
+if ENABLED:
+    atexit.register(dump)
+
+
+class FrameOverlay():
+    """ FPS and frame-time text pinned to the top-left corner of a plot.
+    FPS comes from the intervals between frames drawn back to back: a redraw requested
+    after the graph sat idle (paused, nothing dirty) starts a new run of frames instead
+    of counting the idle time as one slow frame. """
+
+    refresh_interval = 0.25   # seconds between text updates
+    idle_gap = 0.1            # seconds without a redraw request after a frame that count as idle
+
+    def __init__(self, plot_widget, name='render'):
+        import pyqtgraph as pg
+        self.name = name
+        self.text = pg.TextItem(color='#86b9b0', anchor=(0, 0))
+        # child of the view box, not of its content: stays put while panning and zooming
+        self.text.setParentItem(plot_widget.plotItem.vb)
+        self.text.setPos(5, 5)
+        self.frames = RollingHistogram(120)
+        self.last_frame = None
+        self.last_refresh = 0.0
+        self.pending = False
+
+    def requested(self):
+        # a redraw was scheduled; called before frame()
+        if not self.pending:
+            self.pending = True
+            if self.last_frame is not None and time.perf_counter() - self.last_frame > FrameOverlay.idle_gap:
+                self.last_frame = None   # was idle since the last frame
+
+    def frame(self, seconds):
+        now = time.perf_counter()
+        if self.last_frame is not None:
+            self.frames.add((now - self.last_frame) * 1000)
+        self.last_frame = now
+        self.pending = False
+        if now - self.last_refresh >= FrameOverlay.refresh_interval and self.frames.count:
+            self.last_refresh = now
+            intervals = self.frames.values()
+            self.text.setText(f"{1000 / max(intervals.mean(), 1e-6):5.1f} fps  "
+                              f"frame {seconds * 1000:5.1f} ms  p95 interval {np.percentile(intervals, 95):5.1f} ms")
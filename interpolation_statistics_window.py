@@ -1,12 +1,13 @@
-import numpy as np
 from PyQt5 import QtWidgets
 from pyqtgraph import PlotWidget
+from signal_statistics import SignalStatistics
 
 class InterpolationStatisticsWindow(QtWidgets.QWidget):
-    def __init__(self, signal, color):
+    def __init__(self, signal, color, statistics=None):
         super().__init__()
         self.signal = signal
         self.color = color 
+        self.statistics = statistics if statistics is not None else SignalStatistics.of(signal)
         self.initUI()
 
     def initUI(self):
@@ -101,17 +102,17 @@ class InterpolationStatisticsWindow(QtWidgets.QWidget):
         self.result_labels[4].setText(f"{self.calculate_max():.2f}")
 
     def calculate_mean(self):
-        return np.mean(self.signal)
+        return self.statistics.mean
 
     def calculate_std(self):
-        return np.std(self.signal)
+        return self.statistics.std
 
     def calculate_duration(self):
         return len(self.signal)  
 
     def calculate_min(self):
-        return np.min(self.signal)
+        return self.statistics.min
 
     def calculate_max(self):
-        return np.max(self.signal)
+        return self.statistics.max
 
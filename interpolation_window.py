@@ -1,15 +1,14 @@
 import numpy as np
-from scipy.interpolate import interp1d
 import sys
 import os
-from pyqtgraph.exporters import ImageExporter
-from fpdf import FPDF
 from PyQt5 import QtWidgets, QtGui
 from PyQt5.QtWidgets import QWidget, QVBoxLayout, QPushButton, QComboBox, QLabel, QHBoxLayout, QFileDialog, QMessageBox
 import pyqtgraph as pg
 from PyQt5.QtCore import Qt
 from interpolation_statistics_window import InterpolationStatisticsWindow
+from signal_statistics import SignalStatistics
 from utils import Utils
+import instrumentation
 
 class InterpolationWindow(QWidget):
     def __init__(self, signal1, signal2):
@@ -28,6 +27,7 @@ class InterpolationWindow(QWidget):
 
         self.gap = 0
         self.glued_signal = []
+        self.glued_statistics = None   # SignalStatistics of glued_signal, taken on first use
         self.glued_signal_color = 'b'
         self.interpolation_order = 'linear'
 
@@ -191,6 +191,7 @@ class InterpolationWindow(QWidget):
         self.start_pos = None
         self.end_pos = None
         self.glued_signal = []
+        self.glued_statistics = None
         self.region.hide()  
         self.first_signal_plot = self.plot_widget.plot(self.signal1.data, pen=self.signal1.color)
         self.plot_widget.setTitle("First Signal")
@@ -204,6 +205,7 @@ class InterpolationWindow(QWidget):
         self.region.hide()  #default is hidden till used
         self.plot_widget.addItem(self.region)
 
+    @instrumentation.timed('glue')
     def glue_signals(self):
         if self.first_sub_signal is None or self.second_sub_signal is None:
             Utils.show_warning_message("Both signals need to be selected before gluing.")
@@ -244,6 +246,7 @@ class InterpolationWindow(QWidget):
         self.plot_widget.addItem(pg.InfiniteLine(pos=len(sub_y1[:-overlap]) + len(interpolated_part), angle=90, pen=pg.mkPen('w', width=2, style=Qt.DashLine)))  # Line between interpolated part and second sub-signal
 
         self.glued_signal = np.concatenate([sub_y1[:-overlap], interpolated_part, sub_y2[overlap:]])
+        self.glued_statistics = None
         # Enable additional features
         self.gap_slider.setEnabled(True)
         self.change_color_button.setEnabled(True)
@@ -276,6 +279,7 @@ class InterpolationWindow(QWidget):
         y_combined = np.concatenate([sub_y1_overlap, sub_y2_overlap])
 
         
+        from scipy.interpolate import interp1d   # scipy is only loaded once signals are glued
         f = interp1d(x_combined, y_combined, kind=interpolation_order, fill_value=0)
 
         
@@ -303,17 +307,21 @@ class InterpolationWindow(QWidget):
         self.glue_signals()
 
     def show_statistics(self):
-        self.statistics_window = InterpolationStatisticsWindow(self.glued_signal, self.glued_signal_color)
+        self.statistics_window = InterpolationStatisticsWindow(
+            self.glued_signal, self.glued_signal_color, self.statistics())
         self.statistics_window.show()
 
 
+    def statistics(self):
+        # one pass over the glued signal, shared by the statistics window and the report
+        if self.glued_statistics is None:
+            self.glued_statistics = SignalStatistics.of(self.glued_signal)
+        return self.glued_statistics
+
     def calculate_statistics(self):
-        mean_val = np.mean(self.glued_signal)
-        std_val = np.std(self.glued_signal)
-        min_val = np.min(self.glued_signal)
-        max_val = np.max(self.glued_signal)
+        statistics = self.statistics()
         duration = len(self.glued_signal) 
-        return mean_val, std_val, min_val, max_val, duration
+        return statistics.mean, statistics.std, statistics.min, statistics.max, duration
 
     def change_color(self, signal_index):
         color = QtWidgets.QColorDialog.getColor()
@@ -326,13 +334,16 @@ class InterpolationWindow(QWidget):
     def take_snapshot(self):
         self.snapshot_count += 1  # snapshot counter
         img_path = f'snapshot{self.snapshot_count}.png' 
+        from pyqtgraph.exporters import ImageExporter
         exporter = ImageExporter(self.plot_widget.getPlotItem())
         exporter.export(img_path)  
         Utils.show_info_message("Snapshot Saved")
 
+    @instrumentation.timed('report_export')
     def export_report(self):
         mean, std, min_val, max_val, duration = self.calculate_statistics()
         
+        from fpdf import FPDF   # report support is loaded on demand
         pdf = FPDF()
         pdf.add_page()
 
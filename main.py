@@ -7,15 +7,11 @@ import pyqtgraph as pg
 from pyqtgraph import PlotWidget, QtCore
 from PyQt5.QtWidgets import QFileDialog, QMessageBox, QScrollBar, QMenu, QAction
 from utils import Utils
-from statistics_window import StatisticsWindow
-from interpolation_window import InterpolationWindow
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
-from signal import Signal
+from signal_model import Signal
 from signal_plot_widget import SignalPlotWidget
-from polar import PolarPlotWidget
-# from realtime_plot import RealTimePlot
-import pandas as pd
+import instrumentation
+# the Polar and Real-Time tabs (matplotlib, QtChart) and the glue window (scipy, fpdf)
+# are imported when first opened, so they do not slow down startup
 
 
 class SignalApp(QtWidgets.QWidget):
@@ -24,6 +20,7 @@ class SignalApp(QtWidgets.QWidget):
         self.initUI()
         self.signal_to_be_moved = None
         self.real_time_plot = None
+        self.polar_plot_widget = None
 
         # Connect the tab change event
         self.tab_widget.currentChanged.connect(self.on_tab_changed)
@@ -47,7 +44,7 @@ class SignalApp(QtWidgets.QWidget):
 
         #adding tabs
         self.tab_widget.addTab(self.main_tab(), "Main")
-        self.tab_widget.addTab(self.Polar_tab(), "Polar")
+        self.tab_widget.addTab(QtWidgets.QWidget(), "Polar")   # built by on_tab_changed
         # self.tab_widget.addTab(self.real_time_tab(), "Real-Time")
         self.tab_widget.addTab(QtWidgets.QWidget(), "Real-Time") 
         self.tab_widget.setStyleSheet(Utils.tab_style_sheet)
@@ -114,8 +111,8 @@ class SignalApp(QtWidgets.QWidget):
         return main_tab
 
 
-    def Polar_tab(self):
-        polar_tab = QtWidgets.QWidget()
+    def Polar_tab(self, polar_tab):
+        from polar import PolarPlotWidget
         layout = QtWidgets.QVBoxLayout(polar_tab)
 
         #creating instance of PolarPlotWidget for Matplotlib graph
@@ -141,8 +138,11 @@ class SignalApp(QtWidgets.QWidget):
         return polar_tab
 
     def on_tab_changed(self, index):
+        if index == 1 and self.polar_plot_widget is None:   # built the first time it is opened
+            self.Polar_tab(self.tab_widget.widget(index))
         if index == 2:  
             if self.real_time_plot is None:  # Only create if it hasn't been created
+                from realtime_plot import RealTimePlot
                 self.real_time_plot = RealTimePlot()
                 real_time_layout = QtWidgets.QVBoxLayout(self.tab_widget.widget(index))
                 real_time_layout.addWidget(self.real_time_plot)
@@ -160,6 +160,9 @@ class SignalApp(QtWidgets.QWidget):
 
         #sync play state if linked
         if SignalPlotWidget.is_linked:
+            #both graphs follow a single playback clock
+            self.second_graph.use_clock(self.first_graph.clock)
+
             #sync visibility of checkboxes
             self.second_graph.show_hide_checkbox.setChecked(self.first_graph.show_hide_checkbox.isChecked())
 
@@ -175,23 +178,17 @@ class SignalApp(QtWidgets.QWidget):
             lower_speed_index = min(self.first_graph.speed_slider.value(), self.second_graph.speed_slider.value())
             self.first_graph.speed_slider.setValue(lower_speed_index)
             self.second_graph.speed_slider.setValue(lower_speed_index)
-            new_timer_interval = SignalPlotWidget.speed_mapping[lower_speed_index]
-
-            if self.first_graph.timer is not None:
-                self.first_graph.timer.setInterval(new_timer_interval)
-            if self.second_graph.timer is not None:
-                self.second_graph.timer.setInterval(new_timer_interval)
             self.first_graph.link_viewports()
 
         else:
             self.link_button = Utils.update_button(self.link_button, "", "link")
             self.first_graph.unlink_viewports()
+            self.second_graph.use_clock(self.second_graph.own_clock)
 
         #ensure consistent signal speeds
         if SignalPlotWidget.is_linked:
-            if self.first_graph.timer is not None and self.second_graph.timer is not None:
-                if self.first_graph.timer.interval() != self.second_graph.timer.interval():
-                    self.second_graph.timer.setInterval(self.first_graph.timer.interval())  #sync intervals
+            if self.first_graph.clock.speed != self.second_graph.clock.speed:
+                self.second_graph.clock.set_speed(self.first_graph.clock.speed)  #sync speeds
 
 
     def swap_signals(self):
@@ -223,6 +220,7 @@ class SignalApp(QtWidgets.QWidget):
 
     def glue_signals(self):
         if self.first_graph.selected_signal and self.second_graph.selected_signal:
+            from interpolation_window import InterpolationWindow
             self.interpolation_window = InterpolationWindow(
                 self.first_graph.selected_signal, self.second_graph.selected_signal)  #generating Intepolation Window
             self.interpolation_window.show()  # showing Interpolation Window
@@ -329,16 +327,24 @@ class SignalApp(QtWidgets.QWidget):
 
         self.releaseMouse()
 
+    def closeEvent(self, event):
+        # stops the real-time source and flushes any recording still in progress
+        if self.real_time_plot is not None:
+            self.real_time_plot.close()
+        event.accept()
+
     def keyPressEvent(self, event):
         if event.key() == Qt.Key_Control:
             if not self.control_pressed:
                 self.control_pressed = True
+        elif event.key() == Qt.Key_F12 and instrumentation.ENABLED:
+            # timings so far, for stutter reports (also written on exit)
+            Utils.show_info_message(f"Timings written to {instrumentation.dump()}")
 
     def keyReleaseEvent(self, event):
         if event.key() == Qt.Key_Control:
             if self.control_pressed:
                 self.control_pressed = False
-                print("released")
 
 
 if __name__ == "__main__":
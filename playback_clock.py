@@ -0,0 +1,78 @@
+import time
+from pyqtgraph import QtCore
+import instrumentation
+
+
+class PlaybackClock():
+    """ Wall-clock driven cine playback position, in seconds of signal time.
+    Every tick advances the position by the elapsed wall time x speed, so playback runs
+    at the same real speed however long a redraw takes; when rendering falls behind,
+    the next frame simply jumps ahead and the skipped frames are counted as dropped.
+    Several graphs can subscribe to one clock: a tick then hands all of them the same
+    position, so linked graphs stay aligned in time whatever their sampling rates. """
+
+    frame_interval = 16        # ms between ticks, ~60 fps
+    late_tolerance = 1.5       # a tick later than this many intervals counts as late
+
+    def __init__(self, speed=1.0):
+        self.subscribers = []
+        self.speed = speed
+        self.position = 0.0
+        self.last_tick = None
+        self.reset_frame_stats()
+
+        self.timer = QtCore.QTimer()
+        self.timer.setTimerType(QtCore.Qt.PreciseTimer)
+        self.timer.timeout.connect(self.tick)
+
+    def subscribe(self, callback):
+        if callback not in self.subscribers:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def start(self):
+        if self.timer.isActive():
+            return
+        self.last_tick = time.perf_counter()
+        self.timer.start(PlaybackClock.frame_interval)
+
+    def stop(self):
+        self.timer.stop()
+        self.last_tick = None
+
+    def is_running(self):
+        return self.timer.isActive()
+
+    def set_speed(self, speed):
+        self.speed = speed
+
+    def seek(self, position):
+        self.position = position
+
+    def tick(self):
+        now = time.perf_counter()
+        elapsed = now - self.last_tick if self.last_tick is not None else 0.0
+        self.last_tick = now
+        self.position += elapsed * self.speed
+
+        interval = PlaybackClock.frame_interval / 1000
+        if elapsed > interval * PlaybackClock.late_tolerance:
+            self.late_frames += 1
+            self.dropped_frames += int(elapsed / interval) - 1
+            instrumentation.count('playback.late_frames')
+            instrumentation.count('playback.dropped_frames', int(elapsed / interval) - 1)
+        self.rendered_frames += 1
+
+        for callback in list(self.subscribers):
+            callback(self.position)
+
+    def reset_frame_stats(self):
+        self.rendered_frames = 0
+        self.dropped_frames = 0
+        self.late_frames = 0
+
+    def frame_stats(self):
+        return {'rendered': self.rendered_frames, 'dropped': self.dropped_frames, 'late': self.late_frames}
@@ -1,10 +1,8 @@
 import sys
-import pandas as pd
 import numpy as np
 from PyQt5 import QtWidgets
 from PyQt5.QtCore import Qt, QTimer
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-import matplotlib.pyplot as plt
 from matplotlib.figure import Figure
 from utils import Utils
 
@@ -17,12 +15,14 @@ class MplCanvas(FigureCanvas):
         self.setParent(parent)
 
 class PolarPlotWidget(QtWidgets.QWidget):
-    def __init__(self):
+    def __init__(self, trail_length=200):
         super().__init__()
-        df = pd.read_csv('iss_location_data.csv')
+        self.trail_length = trail_length   # points of the track kept on screen (None for the whole track)
+        # Timestamp, Latitude, Longitude columns; read with NumPy, pandas is not needed for two columns
+        latitude, longitude = np.loadtxt('iss_location_data.csv', delimiter=',', skiprows=1, usecols=(1, 2), unpack=True)
 
-        self.theta = np.radians(df['Longitude'].values)  # Convert longitude to radians
-        self.radius = (df['Latitude'].values + 90) / 180  # Normalize latitude to [0, 1] 0 close to south pole, 1 close to north pole
+        self.theta = np.radians(longitude)  # Convert longitude to radians
+        self.radius = (latitude + 90) / 180  # Normalize latitude to [0, 1] 0 close to south pole, 1 close to north pole
 
         
         self.canvas = MplCanvas(self)
@@ -31,6 +31,12 @@ class PolarPlotWidget(QtWidgets.QWidget):
 
         self.canvas.ax_polar.set_title("Sequential Polar Plot of ISS Latitude and Longitude", pad=10, color="white")
         self.canvas.ax_polar.tick_params(colors="#a6a4a1") 
+        self.canvas.ax_polar.set_rlim(0, 1)
+
+        # one persistent line; each tick only its data changes and only it is redrawn (blitting)
+        self.track, = self.canvas.ax_polar.plot([], [], marker='o', linestyle='-', color='blue', animated=True)
+        self.background = None
+        self.canvas.mpl_connect('draw_event', self.on_draw)
         # Speed slider
         self.speed_slider = QtWidgets.QSlider(Qt.Horizontal)
         self.speed_slider.setRange(1, 20)  # Set range for speed factor (1 is slowest, 20 is fastest)
@@ -63,17 +69,23 @@ class PolarPlotWidget(QtWidgets.QWidget):
         if self.current_index >= len(self.theta):
             self.current_index = 0
 
-        # Update the plot with the next data point
-        angle = self.theta[:self.current_index + 1]
-        radius = self.radius[:self.current_index + 1]
-
-        self.canvas.ax_polar.clear()
-        self.canvas.ax_polar.plot(angle, radius, marker='o', linestyle='-', color='blue')
-        self.canvas.ax_polar.set_title("Sequential Polar Plot of ISS Latitude and Longitude", pad=10)
+        # Update the track with the next data point (and its trail)
+        start = 0 if self.trail_length is None else max(self.current_index + 1 - self.trail_length, 0)
+        self.track.set_data(self.theta[start:self.current_index + 1], self.radius[start:self.current_index + 1])
 
-        self.canvas.draw()
+        if self.background is None:
+            self.canvas.draw()   # full draw, on_draw saves the background
+        else:
+            self.canvas.restore_region(self.background)
+            self.canvas.ax_polar.draw_artist(self.track)
+            self.canvas.blit(self.canvas.ax_polar.bbox)
         self.current_index += 1
 
+    def on_draw(self, event):
+        # after every full redraw (first show, resize) save the static background for blitting
+        self.background = self.canvas.copy_from_bbox(self.canvas.ax_polar.bbox)
+        self.canvas.ax_polar.draw_artist(self.track)
+
     def handle_animation(self):
         if self.timer.isActive():
             self.pause_animation()
@@ -1,41 +1,44 @@
-from PyQt5.QtWidgets import QApplication, QHBoxLayout, QWidget, QVBoxLayout, QLabel, QMainWindow, QPushButton
-from PyQt5.QtCore import QTimer, QDateTime, Qt
+from PyQt5.QtWidgets import QApplication, QHBoxLayout, QWidget, QVBoxLayout, QLabel, QMainWindow, QPushButton, QComboBox
+from PyQt5.QtCore import QDateTime, Qt
 from PyQt5.QtGui import QPainter
 from PyQt5.QtChart import QChart, QChartView, QLineSeries, QValueAxis, QDateTimeAxis
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from datetime import datetime, timedelta
+from datetime import datetime
 import sys
-from selenium.webdriver.chrome.options import Options
 from utils import Utils
+from sample_buffer import SampleBuffer
+from data_sources import ReplaySource, SeleniumSource
+from render_scheduler import RenderScheduler
+from recorder import SegmentRecorder
+import pyqtgraph.functions as fn
 
 
 class RealTimePlot(QMainWindow):
-    def __init__(self):
+    retention = 7200    # samples of history kept and plotted (sliding window)
+
+    # selectable sources: label -> factory
+    sources = {
+        "Replay (iss_location_data.csv)": lambda: ReplaySource('iss_location_data.csv', rate=2),
+        "Replay load test (1000 samples/s)": lambda: ReplaySource('iss_location_data.csv', rate=1000),
+        "Live (orbtrack.org)": SeleniumSource,
+    }
+
+    def __init__(self, source=None):
         super().__init__()
         self.series_lat = QLineSeries()     # create series for each of latitude and longitude
         self.series_lon = QLineSeries()
         self.series_lat.setName("Latitude")
         self.series_lon.setName("Longitude")
-        self.data = {'time': [], 'latitude': [], 'longitude': []}
+        # rows of (time in ms since epoch, latitude, longitude) in a ring buffer, so a
+        # long-running session keeps a bounded history
+        self.data = SampleBuffer(channels=3, retention=RealTimePlot.retention)
+        # preallocated point arrays the series are replaced from, one per series
+        self.polygons = {}
+        self.source = None
+        self.recorder = None
         self.initUI()
 
-        options = Options()
-        options.add_argument("--headless") 
-        options.add_argument("--no-sandbox") 
-        
-        # overcome limited resource problems
-        options.add_argument("--disable-dev-shm-usage")
-        self.driver = webdriver.Chrome(service=Service(
-            ChromeDriverManager().install()), options=options)  # init chrome driver
-        
-
-        self.driver.get('https://www.orbtrack.org/#/?satName=ISS%20(ZARYA)')
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_data)    # connect timer with update method
-        self.timer.start(500)  # update every 500 ms
+        # samples are produced on the source's own thread; the tab opens right away
+        self.set_source(source if source is not None else next(iter(RealTimePlot.sources.values()))())
 
     def initUI(self):   
         self.layout = QVBoxLayout()
@@ -58,14 +61,14 @@ class RealTimePlot(QMainWindow):
         self.chart_lat.addSeries(self.series_lat)
         self.chart_lat.legend().setAlignment(Qt.AlignBottom)
         self.chart_lat.setTitle("Real-time ISS Latitude")
-        self.chart_lat.setAnimationOptions(QChart.SeriesAnimations)
+        self.chart_lat.setAnimationOptions(QChart.NoAnimation)   # animating every new point costs a relayout
 
         #longitude chart setup
         self.chart_lon = QChart()
         self.chart_lon.addSeries(self.series_lon)
         self.chart_lon.legend().setAlignment(Qt.AlignBottom)
         self.chart_lon.setTitle("Real-time ISS Longitude")
-        self.chart_lon.setAnimationOptions(QChart.SeriesAnimations)
+        self.chart_lon.setAnimationOptions(QChart.NoAnimation)
 
         #axis setup
         self.axis_x_lat = QDateTimeAxis()
@@ -107,11 +110,20 @@ class RealTimePlot(QMainWindow):
         self.layout.addWidget(self.chart_view_lat)
         self.layout.addWidget(self.chart_view_lon)
 
+        #source selection
+        self.source_combo = QComboBox()
+        self.source_combo.addItems(RealTimePlot.sources)
+        self.source_combo.setStyleSheet(Utils.comboBox_style_sheet)
+        self.source_combo.activated[str].connect(lambda label: self.set_source(RealTimePlot.sources[label]()))
+
         #play/pause button
         self.play_pause_button = Utils.create_button("", self.toggle_timer, "pause")
         self.button_layout.addSpacing(120)
         self.button_layout.addStretch()
+        self.button_layout.addWidget(self.source_combo)
         self.button_layout.addWidget(self.play_pause_button)
+        self.record_button = Utils.create_button("Record", self.toggle_recording)
+        self.button_layout.addWidget(self.record_button)
         self.button_layout.addSpacing(120)
         self.button_layout.addStretch()
         self.layout.addLayout(self.button_layout)
@@ -123,74 +135,98 @@ class RealTimePlot(QMainWindow):
         self.setWindowTitle('Real-time ISS Location')
         self.show()
 
-    def update_data(self):  # called every 500ms by timer to fetch data from website
-        try:    
-            latitude = self.driver.find_element(
-                By.ID, 'satLat').text.replace('°', '').strip()
-            longitude = self.driver.find_element(
-                By.ID, 'satLon').text.replace('°', '').strip()
-            time_str = self.driver.find_element(By.ID, 'satUTC').text.strip()
-            
-
-            #clean and convert strings to floats
-            if latitude == '.':
-                latitude = 0.0
-            else:
-                latitude = float(latitude.replace(',', '.'))
-
-            if longitude == '.':
-                longitude = 0.0
-            else:
-                longitude = float(longitude.replace(',', '.'))
-
-            self.lat_label.setText(f'Latitude: {latitude:.2f}') 
-            self.lon_label.setText(f'Longitude: {longitude:.2f}')
-            self.time_label.setText(f'Time: {time_str}')
-
-            #calculate elapsed time
-            current_time = datetime.now()   #return current LOCAL date  
-            self.data['time'].append(current_time)
-            self.data['latitude'].append(latitude)
-            self.data['longitude'].append(longitude)
-
-            #update series
-            self.series_lat.append(
-                int(current_time.timestamp() * 1000), latitude)
-            self.series_lon.append(
-                int(current_time.timestamp() * 1000), longitude)
-
-            self.axis_x_lat.setMin(QDateTime.fromMSecsSinceEpoch(   # converts this millisecond timestamp into a QDateTime object
-                int(self.data['time'][0].timestamp() * 1000)))  # set min for latitude chart
-            self.axis_x_lat.setMax(QDateTime.fromMSecsSinceEpoch(
-                int(self.data['time'][-1].timestamp() * 1000))) # set max for latitude chart
-
-            self.axis_x_lon.setMin(QDateTime.fromMSecsSinceEpoch(
-                int(self.data['time'][0].timestamp() * 1000)))
-            self.axis_x_lon.setMax(QDateTime.fromMSecsSinceEpoch(
-                int(self.data['time'][-1].timestamp() * 1000)))
-            
-            self.chart_view_lat.update()
-            self.chart_view_lon.update()
-            self.chart_view_lat.repaint()
-            self.chart_view_lon.repaint()
-
-        except ValueError as e:
-            print(f"ValueError: {e}")
-        except Exception as e:
-            print(f"Error: {e}")
+    def set_source(self, source):
+        if self.source is not None:
+            self.source.stop()
+        self.stop_recording()
+        self.source = source
+        self.source.samples.connect(self.update_data)
+        self.source.failed.connect(self.on_source_failed)
+        self.source.start()
+        self.play_pause_button = Utils.update_button(self.play_pause_button, "", "pause")
+
+    def on_source_failed(self, message):
+        self.source.stop()
+        self.play_pause_button = Utils.update_button(self.play_pause_button, "", "play")
+        Utils.show_error_message(f"Real-time source stopped: {message}")
+
+    def update_data(self, rows):  # called on the GUI thread with each batch of (time, latitude, longitude) rows
+        time_ms, latitude, longitude = rows[-1]
+        self.lat_label.setText(f'Latitude: {latitude:.2f}') 
+        self.lon_label.setText(f'Longitude: {longitude:.2f}')
+        self.time_label.setText(f'Time: {datetime.fromtimestamp(time_ms / 1000):%H:%M:%S}')
+
+        self.data.extend(rows)
+        if self.recorder is not None and self.recorder.error:
+            self.stop_recording()
+        if self.recorder is not None:
+            # queued, written on the recorder's thread; the sources are not evenly sampled,
+            # so the time of every sample is kept too
+            self.recorder.write(rows[:, 1:], rows[:, 0])
+        # samples arrive in batches, the charts are redrawn at most once per frame
+        RenderScheduler.instance().mark_dirty(self, RenderScheduler.DATA)
+
+    def render(self, flags=RenderScheduler.ALL):
+        # the whole window goes into each series with a single replace()
+        window = self.data.latest(RealTimePlot.retention)
+        if not window.shape[1]:
+            return
+        self.replace_series(self.series_lat, window[0], window[1])
+        self.replace_series(self.series_lon, window[0], window[2])
+
+        for axis in (self.axis_x_lat, self.axis_x_lon):
+            # converts this millisecond timestamp into a QDateTime object
+            axis.setRange(QDateTime.fromMSecsSinceEpoch(int(window[0][0])),
+                          QDateTime.fromMSecsSinceEpoch(int(window[0][-1])))
+
+    def replace_series(self, series, x, y):
+        polygon, points = self.polygons.get(series, (None, None))
+        if polygon is None:
+            # allocated once at full capacity; until the window is full, the unused tail
+            # repeats the last point, which draws nothing
+            polygon = fn.create_qpolygonf(RealTimePlot.retention)
+            points = fn.ndarray_from_qpolygonf(polygon)
+            self.polygons[series] = (polygon, points)
+        n = len(x)
+        points[:n, 0] = x
+        points[:n, 1] = y
+        points[n:] = points[n - 1]
+        series.replace(polygon)
+
+    def toggle_recording(self):
+        """ Records the samples as rotating .bin segments under recordings/, importable later. """
+        if self.recorder is not None:
+            self.stop_recording()
+            return
+        self.recorder = SegmentRecorder(self.source.name, len(self.source.channel_names),
+                                        self.source.f_sample, dtype='<f8', timestamps=True).start()
+        self.record_button.setText("Stop recording")
+
+    def stop_recording(self):
+        if self.recorder is not None:
+            self.recorder.stop()   # flushes and syncs what is still queued
+            if self.recorder.error:
+                Utils.show_error_message(f"Recording stopped: {self.recorder.error}")
+            self.recorder = None
+        self.record_button.setText("Record")
 
     def toggle_timer(self):
-        if self.timer.isActive():   # when you pause
-            self.timer.stop()
+        if self.source.is_running():   # when you pause
+            self.source.stop()
             self.play_pause_button = Utils.update_button(
                 self.play_pause_button, "", "play")
         else:
-            self.timer.start(500)   #start timer if not active (when you play)
+            try:
+                self.source.start()   #start polling the source again (when you play)
+            except RuntimeError as e:
+                Utils.show_error_message(str(e))
+                return
             self.play_pause_button = Utils.update_button(
                 self.play_pause_button, "", "pause")
 
     def closeEvent(self, event):
-        self.driver.quit()
+        self.source.stop()
+        self.stop_recording()
         event.accept()
 
 
@@ -0,0 +1,147 @@
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+from datetime import datetime
+import numpy as np
+from binary_signal import write_header
+
+RECORDINGS_DIR = 'recordings'
+TIME_DTYPE = '<f8'
+
+
+class SegmentRecorder():
+    """ Write-behind recorder for live samples.
+    `write()` only queues the rows, so acquisition and rendering never wait on the disk; a
+    background thread appends them to rotating segment files. Each segment is a regular
+    self-describing .bin recording (see binary_signal), so it imports like any other file,
+    and `index.json` lists the segments with the first sample and start time of each.
+    With `timestamps`, the time of every sample (ms since epoch, float64) goes to a
+    "segment-NNNN.times" file next to each segment and the index holds the time range of
+    each segment, so irregularly sampled sources can be replayed with their real timing.
+    Data is fsync'ed in batches, at most every `fsync_interval` seconds and at rotation. """
+
+    segment_bytes = 64 * 1024 * 1024
+    fsync_interval = 1.0   # seconds
+    stop_timeout = 5.0     # seconds stop() waits for the queue to be written
+
+    def __init__(self, name, channels, f_sample, dtype='<f4', directory=RECORDINGS_DIR, timestamps=False):
+        self.channels = channels
+        self.f_sample = f_sample
+        self.dtype = np.dtype(dtype)
+        self.timestamps = timestamps
+        self.directory = os.path.join(directory, f"{name}-{datetime.now():%Y%m%d-%H%M%S}")
+        self.queue = queue.SimpleQueue()
+        self.segments = []    # index entries
+        self.file = None
+        self.times_file = None
+        self.n_samples = 0
+        self.thread = None
+        self.error = None
+
+    def start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self.thread = threading.Thread(target=self.run, name="recorder", daemon=True)
+        self.thread.start()
+        return self
+
+    def write(self, rows, times=None):
+        """ Queues (n, channels) rows, or (n,) samples of a single channel, with their times
+        (ms since epoch) when recording timestamps; never blocks. """
+        if self.error is None:   # the writer is gone, do not pile up samples
+            self.queue.put((np.array(rows, dtype=self.dtype),
+                            None if times is None else np.array(times, dtype=TIME_DTYPE)))
+
+    def stop(self):
+        # everything queued so far is written and synced before the thread ends, unless that
+        # takes longer than stop_timeout (the GUI thread waits here)
+        if self.thread is not None:
+            self.queue.put(None)
+            self.thread.join(timeout=self.stop_timeout)
+            if self.thread.is_alive() and self.error is None:
+                self.error = "The last samples are still being written in the background."
+            self.thread = None
+
+    def is_recording(self):
+        return self.thread is not None
+
+    def run(self):
+        last_sync = time.monotonic()
+        stopping = False
+        try:
+            while not stopping:
+                try:
+                    batch = [self.queue.get(timeout=self.fsync_interval)]
+                except queue.Empty:
+                    batch = []
+                # take whatever else is already waiting, one write for all of it
+                while not self.queue.empty():
+                    batch.append(self.queue.get())
+                if batch and batch[-1] is None:   # stop() queues None last
+                    stopping = True
+                    batch.pop()
+                if batch:
+                    rows = np.concatenate([rows for rows, _ in batch]).reshape(-1, self.channels)
+                    times = np.concatenate([times for _, times in batch]) if self.timestamps else None
+                    self.append(rows, times)
+                if self.file is not None and (stopping or time.monotonic() - last_sync >= self.fsync_interval):
+                    self.sync()
+                    last_sync = time.monotonic()
+        except Exception as e:
+            # e.g. disk full: stop recording, keep what was synced; the UI reads `error`
+            self.error = str(e) or type(e).__name__
+        finally:
+            for file in (self.file, self.times_file):
+                if file is not None:
+                    file.close()
+            self.file = self.times_file = None
+
+    def append(self, rows, times=None):
+        while len(rows):
+            if self.file is None or self.file.tell() >= self.segment_bytes:
+                self.rotate()
+            room = max((self.segment_bytes - self.file.tell()) // (self.dtype.itemsize * self.channels), 1)
+            chunk, rows = rows[:room], rows[room:]
+            self.file.write(np.ascontiguousarray(chunk).tobytes())
+            segment = self.segments[-1]
+            if times is not None:
+                chunk_times, times = times[:len(chunk)], times[len(chunk):]
+                self.times_file.write(chunk_times.tobytes())
+                if segment['first_time'] is None:
+                    segment['first_time'] = float(chunk_times[0])
+                segment['last_time'] = float(chunk_times[-1])
+            self.n_samples += len(chunk)
+            segment['n_samples'] += len(chunk)
+
+    def rotate(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            if self.times_file is not None:
+                self.times_file.close()
+        name = f"segment-{len(self.segments):04d}"
+        self.file = open(os.path.join(self.directory, name + '.bin'), 'wb')
+        write_header(self.file, self.dtype, self.channels, self.f_sample)
+        segment = {'file': name + '.bin', 'first_sample': self.n_samples, 'start_time': time.time(), 'n_samples': 0}
+        if self.timestamps:
+            self.times_file = open(os.path.join(self.directory, name + '.times'), 'wb')
+            segment.update({'times': name + '.times', 'first_time': None, 'last_time': None})
+        self.segments.append(segment)
+
+    def sync(self):
+        for file in (self.file, self.times_file):
+            if file is not None:
+                file.flush()
+                os.fsync(file.fileno())
+        self.write_index()
+
+    def write_index(self):
+        index = {'channels': self.channels, 'f_sample': self.f_sample, 'dtype': self.dtype.str,
+                 'segments': self.segments}
+        if self.timestamps:
+            index['times'] = {'dtype': TIME_DTYPE, 'unit': 'ms since epoch'}
+        with tempfile.NamedTemporaryFile(mode='w', dir=self.directory, suffix='.json', delete=False) as file:
+            json.dump(index, file, indent=1)
+        os.replace(file.name, os.path.join(self.directory, 'index.json'))
@@ -0,0 +1,65 @@
+import pyqtgraph as pg
+
+
+class RenderModel():
+    """ Keeps one persistent curve item per Signal on a plot widget.
+    Items are only added or removed when the signal list changes, pens are only
+    rebuilt when a signal's style changes, and data is pushed through setData. """
+
+    def __init__(self, plot_widget):
+        self.plot_widget = plot_widget
+        self.curves = {}    # id(signal) -> [signal, curve item, (color, width)]
+        self.pens = {}      # (color, width) -> QPen, shared by all curves
+        self.rendered_range = None
+
+    def get_pen(self, color, width):
+        key = (color, width)
+        if key not in self.pens:
+            self.pens[key] = pg.mkPen(color=color, width=width)
+        return self.pens[key]
+
+    def sync(self, signals, selected_signal, visible=True):
+        """ Adds/removes curve items to match `signals` and updates their styles. """
+        wanted = {id(signal): signal for signal in signals}
+
+        for key in [key for key in self.curves if key not in wanted]:
+            self.plot_widget.removeItem(self.curves.pop(key)[1])
+
+        for key, signal in wanted.items():
+            style = (signal.color, 4 if signal is selected_signal else 1)
+            if key not in self.curves:
+                item = self.plot_widget.plot(pen=self.get_pen(*style))
+                self.curves[key] = [signal, item, style]
+                self.rendered_range = None   # new curve has no data yet
+            elif self.curves[key][2] != style:
+                self.curves[key][1].setPen(self.get_pen(*style))
+                self.curves[key][2] = style
+            self.curves[key][1].setVisible(visible)
+
+    def update_data(self, x_range, pixels, margin=0.0):
+        """ Pushes the decimated samples of `x_range` into every curve, if not already there.
+        With a margin (fraction of the range width, used during playback) a wider slice is
+        pushed, and later ranges of the same width that still fall inside it cost nothing. """
+        x_min, x_max = x_range
+        width = x_max - x_min
+        if self.rendered_range is not None:
+            rendered_min, rendered_max, rendered_width, rendered_pixels = self.rendered_range
+            if (rendered_pixels == pixels and rendered_min <= x_min and x_max <= rendered_max and
+                    abs(rendered_width - width) <= 1e-6 * max(abs(width), 1e-12)):
+                return
+
+        x_min, x_max = x_min - margin * width, x_max + margin * width
+        pixels_with_margin = int(pixels * (1 + 2 * margin))
+        for signal, item, _ in self.curves.values():
+            item.setData(*signal.render_data(x_min, x_max, pixels_with_margin))
+        self.rendered_range = (x_min, x_max, width, pixels)
+
+    def invalidate(self):
+        # forces the next update_data to push data, e.g. after samples changed in place
+        self.rendered_range = None
+
+    def clear(self):
+        for _, item, _ in self.curves.values():
+            self.plot_widget.removeItem(item)
+        self.curves = {}
+        self.rendered_range = None
@@ -0,0 +1,41 @@
+import time
+from pyqtgraph import QtCore
+
+
+class RenderScheduler():
+    """ Coalesces redraw requests: graphs are marked dirty with what changed and
+    redrawn at most once per display frame, each one independently of the others. """
+
+    DATA = 1     # samples changed (signal added/removed/grown)
+    STYLE = 2    # pens or visibility changed
+    RANGE = 4    # playback window or axis limits changed
+    ALL = DATA | STYLE | RANGE
+
+    frame_interval = 16   # ms, ~60 fps
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        # created on first use, after the QApplication exists
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.dirty = {}    # graph -> accumulated flags
+        self.last_flush = 0.0
+        self.timer = QtCore.QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+
+    def mark_dirty(self, graph, flags=ALL):
+        self.dirty[graph] = self.dirty.get(graph, 0) | flags
+        if not self.timer.isActive():
+            since_last_flush = (time.perf_counter() - self.last_flush) * 1000
+            self.timer.start(int(max(RenderScheduler.frame_interval - since_last_flush, 0)))
+
+    def flush(self):
+        dirty, self.dirty = self.dirty, {}
+        self.last_flush = time.perf_counter()
+        for graph, flags in dirty.items():
+            graph.render(flags)
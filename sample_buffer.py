@@ -0,0 +1,77 @@
+import numpy as np
+
+
+class SampleBuffer():
+    """ Growable sample store for signals that keep receiving data.
+    Storage is preallocated and doubled when full, so appending is amortized O(1) and
+    `view()` is a zero-copy view of the samples so far. Multi-channel buffers are kept
+    channel-major, shape (channels, n), so every channel stays contiguous.
+
+    With a `retention` (in samples) the buffer becomes a ring of fixed capacity
+    2 * retention: once full, the latest `retention` samples are moved back to the front
+    in one copy, so memory stays bounded, appends stay amortized O(1) and views stay
+    contiguous. At least the latest `retention` samples are always kept; `dropped` counts
+    the samples discarded from the front so far. """
+
+    def __init__(self, dtype=np.float64, channels=None, capacity=1024, retention=None):
+        self.channels = channels
+        self.retention = None if retention is None else max(int(retention), 1)
+        if self.retention is not None:
+            capacity = 2 * self.retention
+        self.n = 0
+        self.dropped = 0
+        self.storage = np.empty(self.shape_for(max(int(capacity), 1)), dtype=dtype)
+
+    @classmethod
+    def from_data(cls, data, channels=None, retention=None, headroom=2):
+        """ Buffer holding a copy of `data` ((n,) or channel-major (channels, n)) with room to grow. """
+        buffer = cls(data.dtype, channels, capacity=headroom * max(data.shape[-1], 1024), retention=retention)
+        buffer.extend(data.T)
+        return buffer
+
+    def shape_for(self, capacity):
+        return (capacity,) if self.channels is None else (self.channels, capacity)
+
+    @property
+    def capacity(self):
+        return self.storage.shape[-1]
+
+    def __len__(self):
+        return self.n
+
+    def reserve(self, capacity):
+        if capacity <= self.capacity:
+            return
+        storage = np.empty(self.shape_for(max(capacity, 2 * self.capacity)), dtype=self.storage.dtype)
+        storage[..., :self.n] = self.storage[..., :self.n]
+        self.storage = storage
+
+    def make_room(self, k):
+        # ring mode: keep the samples that stay within the retention window, at the front
+        keep = min(max(self.retention - k, 0), self.n)
+        self.storage[..., :keep] = self.storage[..., self.n - keep:self.n]
+        self.dropped += self.n - keep
+        self.n = keep
+
+    def extend(self, samples):
+        """ Appends samples, (k,) for a mono buffer or row-major (k, channels) otherwise. """
+        samples = np.asarray(samples, dtype=self.storage.dtype)
+        if self.retention is None:
+            self.reserve(self.n + len(samples))
+        else:
+            if len(samples) > self.capacity:
+                self.dropped += self.n + len(samples) - self.capacity
+                self.n = 0
+                samples = samples[-self.capacity:]
+            if self.n + len(samples) > self.capacity:
+                self.make_room(len(samples))
+        k = len(samples)
+        self.storage[..., self.n:self.n + k] = samples.T
+        self.n += k
+
+    def view(self):
+        return self.storage[..., :self.n]
+
+    def latest(self, count):
+        """ Zero-copy contiguous view of (at most) the last `count` samples. """
+        return self.storage[..., max(self.n - int(count), 0):self.n]
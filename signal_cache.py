@@ -0,0 +1,96 @@
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+
+# parsed text recordings are kept as .npy (+ .json metadata) so reopening them is a memory map
+CACHE_DIR = os.environ.get('MSV_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'medsignalscope'))
+MAX_CACHE_BYTES = int(os.environ.get('MSV_CACHE_MAX_BYTES', 2 * 1024 ** 3))
+ENABLED = os.environ.get('MSV_SIGNAL_CACHE', '1') != '0'
+
+
+def cache_key(file_name, dtype):
+    # a file that is edited or replaced gets a new size/mtime, hence a new entry
+    stat = os.stat(file_name)
+    fingerprint = f"{os.path.abspath(file_name)}|{stat.st_size}|{stat.st_mtime_ns}|{np.dtype(dtype).str}"
+    return hashlib.sha1(fingerprint.encode('utf-8')).hexdigest()
+
+
+def entry_paths(key):
+    return os.path.join(CACHE_DIR, key + '.npy'), os.path.join(CACHE_DIR, key + '.json')
+
+
+def load(file_name, dtype=np.float64):
+    """ Returns (data, sampling_rate, title) of a cached parse of file_name, or None.
+    data is a read-only memory map of the cached array. """
+    if not ENABLED:
+        return None
+    try:
+        data_path, meta_path = entry_paths(cache_key(file_name, dtype))
+        with open(meta_path, mode='r') as file:
+            meta = json.load(file)
+        data = np.load(data_path, mmap_mode='r')
+        os.utime(meta_path)   # last use, for LRU eviction
+    except (OSError, ValueError):
+        return None
+    return data, meta['sampling_rate'], meta['title']
+
+
+def contains(file_name, dtype=np.float64):
+    """ Whether file_name has a cache entry; only stats the entry, so nothing is mapped
+    and the LRU order is left alone. """
+    if not ENABLED:
+        return False
+    try:
+        data_path, meta_path = entry_paths(cache_key(file_name, dtype))
+    except OSError:
+        return False
+    return os.path.exists(meta_path) and os.path.exists(data_path)
+
+
+def store(file_name, signal_data, sampling_rate, dtype=np.float64):
+    """ Caches a parsed signal; failures are ignored, the cache is only an accelerator. """
+    if not ENABLED:
+        return
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        data_path, meta_path = entry_paths(cache_key(file_name, dtype))
+        meta = {'source': os.path.abspath(file_name), 'sampling_rate': float(sampling_rate),
+                'title': os.path.splitext(os.path.basename(file_name))[0]}
+
+        # write-then-rename, so concurrent imports never see a half written entry
+        # (the metadata goes last: an entry only counts once its .json exists)
+        with tempfile.NamedTemporaryFile(dir=CACHE_DIR, suffix='.npy', delete=False) as file:
+            np.save(file, np.asarray(signal_data))
+        os.replace(file.name, data_path)
+        with tempfile.NamedTemporaryFile(mode='w', dir=CACHE_DIR, suffix='.json', delete=False) as file:
+            json.dump(meta, file)
+        os.replace(file.name, meta_path)
+        evict()
+    except OSError:
+        pass
+
+
+def evict(max_bytes=MAX_CACHE_BYTES):
+    """ Removes least recently used entries until the cache fits in max_bytes. """
+    entries = []
+    for name in os.listdir(CACHE_DIR):
+        if name.endswith('.json'):
+            data_path, meta_path = entry_paths(name[:-len('.json')])
+            try:
+                size = os.path.getsize(data_path) + os.path.getsize(meta_path)
+                entries.append((os.path.getmtime(meta_path), size, data_path, meta_path))
+            except OSError:
+                continue
+
+    total = sum(entry[1] for entry in entries)
+    for _, size, data_path, meta_path in sorted(entries):
+        if total <= max_bytes:
+            break
+        for path in (meta_path, data_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        total -= size
@@ -0,0 +1,189 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from PyQt5 import QtCore, QtWidgets
+
+
+class ImportCancelled(Exception):
+    pass
+
+
+class ImportTaskSignals(QtCore.QObject):
+    # created on the GUI thread, so the connected slots run there too (queued connections)
+    progress = QtCore.pyqtSignal(str, int)
+    finished = QtCore.pyqtSignal(str, object, float)
+    failed = QtCore.pyqtSignal(str, str)
+    cancelled = QtCore.pyqtSignal(str)
+
+
+class ImportTask(QtCore.QRunnable):
+    """ Parses one signal file on a worker thread of the global QThreadPool. """
+
+    def __init__(self, file_name, read_function, cancel_event):
+        super().__init__()
+        self.file_name = file_name
+        self.read_function = read_function
+        self.cancel_event = cancel_event
+        self.signals = ImportTaskSignals()
+
+    def run(self):
+        try:
+            if self.cancel_event.is_set():
+                raise ImportCancelled()
+            signal_data, sampling_rate = self.read_function(
+                self.file_name,
+                progress=lambda percent: self.signals.progress.emit(self.file_name, int(percent)),
+                is_cancelled=self.cancel_event.is_set)
+            if self.cancel_event.is_set():
+                raise ImportCancelled()
+        except ImportCancelled:
+            self.signals.cancelled.emit(self.file_name)
+        except Exception as e:
+            self.signals.failed.emit(self.file_name, str(e))
+        else:
+            self.signals.finished.emit(self.file_name, signal_data, float(sampling_rate))
+
+
+class BulkImportTask(QtCore.QRunnable):
+    """ Parses many files in a process pool (text parsing is CPU bound and holds the GIL).
+    Files for which `in_process` is false, e.g. memory-mapped ones, are opened in this
+    thread instead, since sending their data back from a process would copy it. """
+
+    def __init__(self, file_names, read_function, cancel_event, in_process, max_workers=None):
+        super().__init__()
+        self.file_names = file_names
+        self.read_function = read_function
+        self.cancel_event = cancel_event
+        self.in_process = in_process
+        self.max_workers = max_workers
+        self.signals = ImportTaskSignals()
+
+    def run(self):
+        self.pending = list(self.file_names)
+        local_files = [file_name for file_name in self.file_names if not self.in_process(file_name)]
+        try:
+            # spawn, not fork: forking a multi-threaded Qt process is unsafe
+            with ProcessPoolExecutor(max_workers=self.max_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                futures = {executor.submit(self.read_function, file_name): file_name
+                           for file_name in self.file_names if file_name not in local_files}
+                for file_name in local_files:
+                    self.finish(file_name, lambda: self.read_function(file_name))
+                for future in as_completed(futures):
+                    if self.cancel_event.is_set():
+                        break
+                    self.finish(futures[future], future.result)
+                # after a cancel, files not started yet are dropped (leaving the loop first,
+                # so the futures are not cancelled while they are being iterated)
+                executor.shutdown(cancel_futures=True)
+                for file_name in list(self.pending):
+                    self.finish(file_name, None)   # reported as cancelled
+        except (OSError, BrokenProcessPool):
+            # no usable process pool here: parse whatever is left in this thread
+            for file_name in list(self.pending):
+                self.finish(file_name, lambda: self.read_function(file_name))
+
+    def finish(self, file_name, get_result):
+        self.pending.remove(file_name)
+        if self.cancel_event.is_set():
+            self.signals.cancelled.emit(file_name)
+            return
+        try:
+            signal_data, sampling_rate = get_result()
+        except BrokenProcessPool:
+            # the pool itself failed, not this file: run() falls back to parsing in this thread
+            self.pending.append(file_name)
+            raise
+        except Exception as e:
+            self.signals.failed.emit(file_name, str(e))
+        else:
+            self.signals.finished.emit(file_name, signal_data, float(sampling_rate))
+
+
+class SignalImporter(QtCore.QObject):
+    """ Imports several files at once without blocking the GUI thread.
+    Parsed arrays come back through `loaded(file_name, data, sampling_rate)` on the GUI
+    thread as each file finishes, and all together through `loaded_batch` at the end;
+    a non-modal progress dialog shows the overall progress and can cancel.
+    With `in_process`, files are parsed in a process pool instead of worker threads. """
+
+    loaded = QtCore.pyqtSignal(str, object, float)
+    loaded_batch = QtCore.pyqtSignal(object)   # [(file_name, data, sampling_rate)] in file order
+    failed = QtCore.pyqtSignal(str, str)
+    done = QtCore.pyqtSignal()
+
+    active = set()   # keeps running importers alive until they are done
+
+    def __init__(self, file_names, read_function, parent=None, in_process=None):
+        super().__init__()
+        self.file_names = list(file_names)
+        self.read_function = read_function
+        self.in_process = in_process
+        self.results = {}
+        self.cancel_event = threading.Event()
+        self.file_progress = {file_name: 0 for file_name in self.file_names}
+        self.remaining = len(self.file_names)
+
+        self.progress_dialog = QtWidgets.QProgressDialog("Importing signals...", "Cancel", 0, 100, parent)
+        self.progress_dialog.setWindowTitle("Import")
+        self.progress_dialog.setWindowModality(QtCore.Qt.NonModal)
+        self.progress_dialog.setMinimumDuration(500)   # only shows up for slow imports
+        self.progress_dialog.canceled.connect(self.cancel)
+
+    def start(self):
+        SignalImporter.active.add(self)
+        if not self.file_names:
+            QtCore.QTimer.singleShot(0, self.finish)
+            return self
+
+        if self.in_process is not None:
+            tasks = [BulkImportTask(self.file_names, self.read_function, self.cancel_event, self.in_process)]
+        else:
+            tasks = [ImportTask(file_name, self.read_function, self.cancel_event) for file_name in self.file_names]
+        for task in tasks:
+            task.signals.progress.connect(self.on_progress)
+            task.signals.finished.connect(self.on_finished)
+            task.signals.failed.connect(self.on_failed)
+            task.signals.cancelled.connect(self.on_task_done)
+            QtCore.QThreadPool.globalInstance().start(task)
+        return self
+
+    def cancel(self):
+        self.cancel_event.set()
+
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+
+    def on_progress(self, file_name, percent):
+        self.file_progress[file_name] = percent
+        if not self.progress_dialog.wasCanceled():
+            self.progress_dialog.setLabelText(f"Importing {os.path.basename(file_name)}...")
+            self.progress_dialog.setValue(sum(self.file_progress.values()) // len(self.file_progress))
+
+    def on_finished(self, file_name, signal_data, sampling_rate):
+        if not self.is_cancelled():
+            self.results[file_name] = (file_name, signal_data, sampling_rate)
+            self.loaded.emit(file_name, signal_data, sampling_rate)
+        self.on_task_done(file_name)
+
+    def on_failed(self, file_name, message):
+        self.failed.emit(file_name, message)
+        self.on_task_done(file_name)
+
+    def on_task_done(self, file_name):
+        self.on_progress(file_name, 100)
+        self.remaining -= 1
+        if self.remaining == 0:
+            self.finish()
+
+    def finish(self):
+        self.progress_dialog.canceled.disconnect(self.cancel)   # closing the dialog emits canceled
+        self.progress_dialog.reset()
+        self.progress_dialog.close()
+        SignalImporter.active.discard(self)
+        if not self.is_cancelled():
+            self.loaded_batch.emit([self.results[file_name] for file_name in self.file_names
+                                    if file_name in self.results])
+        self.done.emit()
@@ -0,0 +1,150 @@
+import numpy as np
+import sys
+from PyQt5 import QtWidgets
+from signal_pyramid import MinMaxPyramid
+from sample_buffer import SampleBuffer
+from signal_statistics import SignalStatistics
+
+
+class TimeAxis():
+    """ Implicit, evenly sampled time base described by (t0, f_sample, n).
+    Samples are only materialized when indexed, so it costs no memory per sample. """
+
+    def __init__(self, t0=0.0, f_sample=100, n=0):
+        self.t0 = float(t0)
+        self.f_sample = float(f_sample)
+        self.n = int(n)
+
+    @property
+    def dt(self):
+        return 1.0 / self.f_sample
+
+    @property
+    def start(self):
+        return self.t0
+
+    @property
+    def end(self):
+        # time of the last sample (t0 for an empty axis)
+        return self.t0 + max(self.n - 1, 0) * self.dt
+
+    def __len__(self):
+        return self.n
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self.n)
+            return self.t0 + np.arange(start, stop, step) * self.dt
+        if isinstance(index, (int, np.integer)):
+            if index < 0:
+                index += self.n
+            if not 0 <= index < self.n:
+                raise IndexError("time axis index out of range")
+            return self.t0 + index * self.dt
+        # fancy indexing with an array of sample indices
+        index = np.asarray(index)
+        return self.t0 + np.where(index < 0, index + self.n, index) * self.dt
+
+    def __array__(self, dtype=None, copy=None):
+        return self[:] if dtype is None else self[:].astype(dtype)
+
+    def searchsorted(self, t, side='left'):
+        # same contract as np.searchsorted on the materialized axis, solved in closed form
+        # since the axis is sorted and evenly spaced
+        position = round((t - self.t0) * self.f_sample, 6)   # absorb float noise at exact sample times
+        index = int(np.ceil(position)) if side == 'left' else int(np.floor(position)) + 1
+        return min(max(index, 0), self.n)
+
+    def index_of(self, t):
+        # nearest sample index for time t, clamped to the axis
+        if self.n == 0:
+            return 0
+        index = int(round((t - self.t0) * self.f_sample))
+        return min(max(index, 0), self.n - 1)
+
+    def __repr__(self):
+        return f"TimeAxis(t0={self.t0}, f_sample={self.f_sample}, n={self.n})"
+
+
+class Signal():
+
+    def __init__(self, signal_data, color='b', title='signal', is_hidden=False, f_sample=100):
+        self.pyramid = MinMaxPyramid()
+        self.data = signal_data
+        self.color = color
+        self.title = title
+        self.is_hidden = is_hidden
+        self.f_sample = f_sample
+        self.time_axis = TimeAxis(0, self.f_sample, len(signal_data))
+        # set for channels of a multi-channel ChannelBlock
+        self.block = None
+        self.channel = None
+        self.source = None   # file the samples were imported from, if any
+        self.buffer = None   # SampleBuffer once samples are appended
+        self.retention = None   # seconds kept once appending (None keeps everything)
+
+    @property
+    def data(self):
+        return self._data
+
+    @data.setter
+    def data(self, signal_data):
+        # new samples invalidate the level-of-detail pyramid and the statistics, both are rebuilt lazily
+        self._data = signal_data
+        self.pyramid.reset()
+        self._statistics = None
+
+    def grow(self, signal_data, shifted=False):
+        """ Replaces the data with a longer version of itself, keeping what the pyramid
+        already indexed; `shifted` means old samples were dropped from the front. """
+        if shifted:
+            self.pyramid.reset()
+            self._statistics = None
+        elif self._statistics is not None:
+            self._statistics.update(signal_data[len(self._data):])
+        self._data = signal_data
+        self.time_axis.n = len(signal_data)
+
+    def append(self, samples):
+        """ Appends samples; the first call copies the data into a growable buffer
+        (a ring buffer keeping `retention` seconds, if set). """
+        if self.buffer is None:
+            retention = None if self.retention is None else self.retention * self.f_sample
+            self.buffer = SampleBuffer.from_data(np.asarray(self._data), retention=retention)
+            dropped = 0
+        else:
+            dropped = self.buffer.dropped
+        self.buffer.extend(samples)
+        # samples that left the retention window move the start of the time axis
+        self.time_axis.t0 += (self.buffer.dropped - dropped) / self.f_sample
+        self.grow(self.buffer.view(), shifted=self.buffer.dropped != dropped)
+
+    def statistics(self):
+        """ SignalStatistics of the samples, computed on first use and kept up to date as
+        samples are appended; channels of a block share the block's. """
+        if self.block is not None:
+            return self.block.statistics().channel(self.channel)
+        if self._statistics is None:
+            self._statistics = SignalStatistics.of(self._data)
+        return self._statistics
+
+    def latest(self, seconds):
+        """ Zero-copy view of the samples of the last `seconds`. """
+        return self._data[max(len(self._data) - int(seconds * self.f_sample), 0):]
+
+    def render_data(self, x_min, x_max, pixels):
+        """ (x, y) arrays of the samples in [x_min, x_max], decimated for a plot `pixels` wide. """
+        return self.pyramid.render_data(self._data, self.time_axis, x_min, x_max, pixels)
+
+
+    def change_color(self):
+        color = QtWidgets.QColorDialog.getColor()
+        if color.isValid():
+            self.color = color.name()
+
+    def __lt__(self, other):
+        return len(self.data) < len(other.data)
+
+    def __repr__(self):
+        return str(self.data)
+
@@ -1,4 +1,5 @@
 import sys
+import time
 import numpy as np
 from PyQt5.QtWidgets import QApplication, QVBoxLayout, QPushButton, QWidget
 import pyqtgraph as pg
@@ -8,7 +9,12 @@ from utils import Utils
 from pyqtgraph import PlotWidget, QtCore
 from PyQt5.QtCore import Qt
 from statistics_window import StatisticsWindow
-from signal import Signal
+from signal_model import Signal, TimeAxis
+from render_model import RenderModel
+from playback_clock import PlaybackClock
+from render_scheduler import RenderScheduler
+from file_follower import FileFollower
+import instrumentation
 
 
 class SignalPlotWidget():
@@ -18,33 +24,39 @@ class SignalPlotWidget():
     stopped_by_link = False
     graph_instances = []
     speed_mapping = {
-        0: 200,  # x1/2 speed
-        1: 100,  # Original speed
-        2: 50,   # x2 speed
-        3: 25    # x4 speed
+        0: 0.5,  # x1/2 speed
+        1: 1,    # Original speed
+        2: 2,    # x2 speed
+        3: 4     # x4 speed
     }
     toggle_link = lambda: None
+    playback_margin = 0.5   # extra fraction of the window rendered on each side while playing
+    follow_retention = None   # seconds of a followed text recording kept in memory (None keeps all)
+    # id(signal or channel block) -> FileFollower of its growing file; shared by both graphs,
+    # since a followed signal can be moved or swapped to the other one
+    followers = {}
 
-    def __init__(self, signals, is_playing=False, speed=1, window_range=(0, 30), timer=None, name='', preserve_zoom=False):
+    def __init__(self, signals, is_playing=False, speed=1, window_range=(0, 30), name='', preserve_zoom=False):
         super().__init__()
         self.signals = signals
         self.selected_signal = self.signals[0]
         self.is_playing = is_playing
         self.speed = speed
         self.window_range = window_range
-        self.timer = timer
+        # playback clock this graph follows; linked graphs share the first graph's clock
+        self.own_clock = PlaybackClock(SignalPlotWidget.speed_mapping[speed])
+        self.clock = self.own_clock
+        self.clock.subscribe(self.update_plot)
         self.name = name
         self.window_start, self.window_end = window_range
         self.preserve_zoom = preserve_zoom  
 
         self.max_length = len(max(self.signals).data)
-        self.max_time_axis = np.linspace(0, self.max_length/100, self.max_length)
+        self.max_time_axis = TimeAxis(0, 100, self.max_length)
         self.other = None
+        self.stream_service = None   # StreamIngestService feeding live ports into this graph
 
-        self.yMin = min(min(signal.data)
-                        for signal in self.signals) if self.signals else self.yMin
-        self.yMax = max(max(signal.data)
-                        for signal in self.signals) if self.signals else self.yMax
+        self.yMin, self.yMax = self.get_global_min_and_max() or (-1, 1)
 
         # graph layout
         self.graph_layout = QtWidgets.QHBoxLayout()
@@ -65,7 +77,13 @@ class SignalPlotWidget():
             self.on_user_interaction_start)
 
         self.plot_widget.scene().sigMouseClicked.connect(self.on_signal_clicked)
+
+        # one persistent curve per signal, re-sampled whenever the visible x range changes
+        self.render_model = RenderModel(self.plot_widget)
+        self.plot_widget.plotItem.vb.sigXRangeChanged.connect(self.refresh_curves)
         self.plot_widget.setTitle(self.name)
+        # FPS/frame-time text, only with MSV_FPS_OVERLAY=1
+        self.frame_overlay = instrumentation.FrameOverlay(self.plot_widget) if instrumentation.OVERLAY else None
 
         # show/hide checkBox
         self.show_hide_checkbox = QtWidgets.QCheckBox("Hide")
@@ -118,13 +136,21 @@ class SignalPlotWidget():
         self.zoom_out_button = Utils.create_button(f"", self.zoom_out, "zoom_out")
         self.button_layout.addWidget(self.zoom_out_button)
 
-        self.change_color_button = Utils.create_button(f"", lambda: (self.selected_signal.change_color(), self.plot_signals()), "color")
+        self.change_color_button = Utils.create_button(f"", lambda: (self.selected_signal.change_color(), self.schedule_render(RenderScheduler.STYLE)), "color")
         self.button_layout.addWidget(self.change_color_button)
         
         self.statistics_button = Utils.create_button(f"", self.show_statistics, "statistics")
         self.button_layout.addWidget(self.statistics_button)
 
-        self.button_layout.addWidget(Utils.create_button("", lambda: (Utils.import_signal_file(self), self.update_graph()), "import"))
+        self.button_layout.addWidget(Utils.create_button("", lambda: Utils.import_signal_file(self), "import"))
+        self.button_layout.addWidget(Utils.create_button("Folder", lambda: Utils.import_signal_folder(self)))
+
+        self.follow_button = Utils.create_button("Follow", self.toggle_follow,
+                                                 set_enabled=self.selected_signal.source is not None)
+        self.button_layout.addWidget(self.follow_button)
+
+        self.ports_button = Utils.create_button("Ports", self.toggle_stream)
+        self.button_layout.addWidget(self.ports_button)
 
         self.delete_signal_button = Utils.create_button(f"", self.delete_signal, icon_name="delete_1")
         self.button_layout.addWidget(self.delete_signal_button)
@@ -152,12 +178,14 @@ class SignalPlotWidget():
             self.selected_signal = self.signals[-1]
             self.title_input.setText(self.selected_signal.title)
             self.max_length = len(max(self.signals).data)
-            self.yMin = min(min(self.signals[-1].data), self.yMin)
-            self.yMax = max(max(self.signals[-1].data), self.yMin)
-            self.plot_signals()
+            statistics = self.signals[-1].statistics()
+            if statistics.count:   # a live port has no samples before its first frame
+                self.yMin = min(float(statistics.min), self.yMin)
+                self.yMax = max(float(statistics.max), self.yMax)
+            self.schedule_render()
         else:
             self.selected_signal = None
-            self.plot_widget.clear()
+            self.render_model.clear()
         self.enable_buttons()
 
     def on_user_interaction_start(self):
@@ -173,11 +201,8 @@ class SignalPlotWidget():
         #current slider value in sig.1
         current_value = self.speed_slider.value()
 
-        #change timer interval based on slider value
-        new_timer_interval = SignalPlotWidget.speed_mapping[current_value]
-
-        if self.timer is not None:
-            self.timer.setInterval(new_timer_interval)
+        #change playback speed based on slider value
+        self.clock.set_speed(SignalPlotWidget.speed_mapping[current_value])
 
         #if linked, update other slider too
         if SignalPlotWidget.is_linked:
@@ -192,27 +217,44 @@ class SignalPlotWidget():
         if state == Qt.Checked:
             #plot signal only if checked
             self.show_hide_checkbox.setText("Hide")
-            self.plot_widget.clear()
-            for signal in self.signals:
-                if signal == self.selected_signal:
-                    pen = pg.mkPen(color=signal.color, width=4)
-                else:
-                    pen = pg.mkPen(color=signal.color, width=1)
-                self.plot_widget.plot(self.max_time_axis,
-                                      signal.data, pen=pen)
+            self.schedule_render(RenderScheduler.STYLE)
             self.plot_widget.setYRange(-1, 1)
             # self.plot_widget.setTitle(self.title_input.text())
         else:
-            self.plot_widget.clear()  #clear plot if unchecked
+            self.schedule_render(RenderScheduler.STYLE)  #hide curves if unchecked
             self.show_hide_checkbox.setText("Show")
 
 
-    def update_plot(self):
+    @instrumentation.timed('update_plot')
+    def update_plot(self, position):
         if self.is_playing and SignalPlotWidget.user_interacting:
             window_size = self.window_end - self.window_start  # how much is visible at once
-            self.window_start = (self.window_start + 1) % (len(self.selected_signal.data) - window_size)  
-            self.window_end = self.window_start + window_size
-            self.plot_signals()
+            # loop back to the start once the window reaches the end of the longest signal
+            # (locally, the clock may be shared with a graph of a different length)
+            loop_duration = max(len(self.max_time_axis) - window_size, 1) / self.max_time_axis.f_sample
+            position %= loop_duration
+
+            window_start = self.max_time_axis.searchsorted(self.max_time_axis.start + position)
+            if window_start != self.window_start:   # nothing new to show until a sample boundary is crossed
+                self.window_start = window_start
+                self.window_end = self.window_start + window_size
+                self.schedule_render(RenderScheduler.RANGE)
+
+    def use_clock(self, clock):
+        # follow another playback clock (the shared one when linking, our own when unlinking)
+        if clock is self.clock:
+            return
+        previous = self.clock
+        previous.unsubscribe(self.update_plot)
+        if not previous.subscribers:
+            previous.stop()
+        if not clock.subscribers:
+            clock.seek(previous.position)
+            clock.set_speed(previous.speed)
+        clock.subscribe(self.update_plot)
+        self.clock = clock
+        if self.is_playing:
+            self.clock.start()
 
 
     def link_viewports(self):
@@ -224,9 +266,12 @@ class SignalPlotWidget():
         self.plot_widget.sigRangeChanged.disconnect(self.sync_range)
         self.other.plot_widget.sigRangeChanged.disconnect(self.other.sync_range)
 
+    @instrumentation.timed('sync_range')
     def sync_range(self):
         if SignalPlotWidget.syncing:
             return  # Prevent recursive syncing
+        if self.clock is self.other.clock and self.clock.is_running():
+            return  # linked playback: both graphs already follow the shared clock
         SignalPlotWidget.syncing = True
 
         range_ = self.plot_widget.viewRange()
@@ -245,24 +290,55 @@ class SignalPlotWidget():
             self.is_playing = True
             self.play_pause_button = Utils.update_button(
                 self.play_pause_button, "", "pause")
-            if self.timer is None:
-                self.timer = pg.QtCore.QTimer()
-                self.timer.timeout.connect(self.update_plot)
-                self.timer.start(100) 
+            self.clock.seek(self.window_start / self.max_time_axis.f_sample)   # resume where the window is
+            self.clock.start()
             if SignalPlotWidget.is_linked and not self.other.is_playing:
                 self.other.play_pause_signal()
 
         else:
             self.is_playing = False
+            if not any(graph.is_playing for graph in SignalPlotWidget.graph_instances if graph.clock is self.clock):
+                self.clock.stop()
             self.play_pause_button = Utils.update_button(
                 self.play_pause_button, "", "play")
             if SignalPlotWidget.is_linked and self.other.is_playing:
                 self.other.play_pause_signal()
 
 
+    def draw_curves(self):
+        # add/remove/restyle only what changed, then push the visible window's data
+        visible = self.show_hide_checkbox.isChecked()
+        self.render_model.sync(self.signals, self.selected_signal, visible)
+        if visible:
+            self.render_model.update_data(self.render_range(), self.plot_width(), self.render_margin())
+
+    def refresh_curves(self):
+        # re-pick the level of detail of every curve for the new visible range
+        if self.render_model.curves and self.show_hide_checkbox.isChecked():
+            self.render_model.update_data(tuple(self.plot_widget.viewRange()[0]), self.plot_width(),
+                                          self.render_margin())
+
+    def render_margin(self):
+        # during playback only the window (plus a margin) is sliced, and re-sliced once it runs out
+        if self.is_playing and SignalPlotWidget.user_interacting:
+            return SignalPlotWidget.playback_margin
+        return 0.0
+
+    def render_range(self):
+        # x range the curves are about to be shown in
+        if SignalPlotWidget.user_interacting:
+            return self.current_window_range()
+        if self.plot_widget.plotItem.vb.autoRangeEnabled()[0] and self.signals:
+            return (min(signal.time_axis.start for signal in self.signals),
+                    max(signal.time_axis.end for signal in self.signals))
+        return tuple(self.plot_widget.viewRange()[0])
+
+    def plot_width(self):
+        # width of the plot area in pixels (fallback before the widget is laid out)
+        return int(self.plot_widget.plotItem.vb.width()) or 1000
+
+    @instrumentation.timed('plot_signals')
     def plot_signals(self):
-        self.plot_widget.clear()
-        self.other.plot_widget.clear()
         if not self.preserve_zoom:
             self.original_x_range = self.plot_widget.viewRange()[0]
             self.original_y_range = self.plot_widget.viewRange()[1]
@@ -275,52 +351,39 @@ class SignalPlotWidget():
         if SignalPlotWidget.is_linked:
             SignalPlotWidget.sync_range(self)
 
-        if self.show_hide_checkbox.isChecked():
-            for signal in self.signals:
-                if signal == self.selected_signal:
-                    pen = pg.mkPen(color=signal.color, width=4)
-                else:
-                    pen = pg.mkPen(color=signal.color, width=1)
-                self.plot_widget.plot(
-                    signal.time_axis, signal.data, pen=pen)
-
+        self.render()
+        self.other.render(fit_y=False)
+
+    def schedule_render(self, flags=RenderScheduler.ALL):
+        # redraw this graph (only) on the next frame, together with anything else that changed
+        if self.frame_overlay is not None:
+            self.frame_overlay.requested()
+        RenderScheduler.instance().mark_dirty(self, flags)
+
+    @instrumentation.timed('render')
+    def render(self, flags=RenderScheduler.ALL, fit_y=True):
+        # redraws this graph only
+        started = time.perf_counter()
+        if flags & RenderScheduler.DATA:
+            self.render_model.invalidate()
+        self.draw_curves()
+        if self.show_hide_checkbox.isChecked() and flags & (RenderScheduler.DATA | RenderScheduler.RANGE):
             if SignalPlotWidget.user_interacting:
-                current_time_window = self.max_time_axis[self.window_start:self.window_end]
-                self.plot_widget.setXRange(
-                    min(current_time_window), max(current_time_window), padding=0)
+                self.plot_widget.setXRange(*self.current_window_range(), padding=0)
 
-            if not self.preserve_zoom:
-                global_min, global_max = self.get_global_min_and_max()
-                self.plot_widget.setYRange(global_min, global_max)
+            if fit_y and not self.preserve_zoom and self.signals:
+                global_range = self.get_global_min_and_max()
+                if global_range is None:
+                    self.plot_widget.setYRange(-1, 1)   # no samples yet
+                else:
+                    self.plot_widget.setYRange(*global_range)
             # self.plot_widget.setTitle(self.title_input.text())
 
             # panning within limits
             self.plot_widget.setLimits(
-                xMin=min(self.max_time_axis), xMax=max(self.max_time_axis), yMin=self.yMin, yMax=self.yMax)
-
-        if self.other.show_hide_checkbox.isChecked():
-            for signal in self.other.signals:
-                if signal == self.other.selected_signal:
-                    pen = pg.mkPen(color=signal.color, width=4)
-                else:
-                    pen = pg.mkPen(color=signal.color, width=1)
-
-                self.other.plot_widget.plot(
-                    signal.time_axis, signal.data, pen=pen)
-
-            # case of user interaction
-            if SignalPlotWidget.user_interacting:
-                current_time_window = self.other.max_time_axis[
-                    self.other.window_start:self.other.window_end]
-                self.other.plot_widget.setXRange(
-                    min(current_time_window), max(current_time_window), padding=0)
-
-            # self.other.plot_widget.setYRange(-1, 1)
-            # self.other.plot_widget.setTitle(self.other.title_input.text())
-
-            #panning within limis
-            self.other.plot_widget.setLimits(
-                xMin=min(self.other.max_time_axis), xMax=max(self.other.max_time_axis), yMin=self.other.yMin, yMax=self.other.yMax)
+                xMin=self.max_time_axis.start, xMax=self.max_time_axis.end, yMin=self.yMin, yMax=self.yMax)
+        if self.frame_overlay is not None:
+            self.frame_overlay.frame(time.perf_counter() - started)
 
     def stop_signal(self):
         if self.show_hide_checkbox.isChecked():
@@ -332,8 +395,9 @@ class SignalPlotWidget():
 
         self.window_start = 0
         self.window_end = min(30, self.max_length)
+        self.clock.seek(0)
         SignalPlotWidget.stopped_by_link = False
-        self.plot_signals()
+        self.schedule_render(RenderScheduler.RANGE)
 
     def zoom_in(self):
         if isinstance(self.plot_widget, PlotWidget):
@@ -385,14 +449,14 @@ class SignalPlotWidget():
 
         # Loop through each signal to find the closest one to the click
         for signal in self.signals:
-            signal_data = signal.data
-            x_data = self.max_time_axis[:len(signal_data)] # avoid out of bounds error
-            y_data = signal_data
-            index = (np.abs(x_data - x_mouse)).argmin()
-            y_value_at_index = y_data[index]
+            if len(signal.data) == 0:
+                continue
+            # nearest sample computed from the time base, no search over the whole axis
+            index = signal.time_axis.index_of(x_mouse)
+            y_value_at_index = signal.data[index]
 
             distance = np.sqrt(
-                (x_mouse - x_data[index])**2 + (y_mouse - y_value_at_index)**2)
+                (x_mouse - signal.time_axis[index])**2 + (y_mouse - y_value_at_index)**2)
 
             # compare with previous distances
             if distance < min_distance:
@@ -403,15 +467,117 @@ class SignalPlotWidget():
             # Set the selected signal
             self.selected_signal = closest_signal
             self.title_input.setText(self.selected_signal.title)
-            self.plot_signals()
+            self.update_follow_button()
+            self.schedule_render(RenderScheduler.STYLE)
+
+    def follow_target(self, signal):
+        # channels of a multi-channel file grow together, so their block is followed
+        return signal.block if signal.block is not None else signal
+
+    def toggle_follow(self):
+        """ Starts/stops following the selected signal's file as it keeps being written. """
+        target = self.follow_target(self.selected_signal)
+        if id(target) in SignalPlotWidget.followers:
+            SignalPlotWidget.stop_following(target)
+        else:
+            target.retention = SignalPlotWidget.follow_retention
+            try:
+                follower = FileFollower(target, target.source)
+            except (OSError, ValueError) as e:
+                Utils.show_error_message(f"Could not follow {self.selected_signal.title}: {e}")
+                return
+            # grows whichever graph shows the signal when the new samples arrive
+            follower.grown.connect(lambda n_new: SignalPlotWidget.extend_target(target, n_new))
+            follower.failed.connect(lambda message: (
+                SignalPlotWidget.stop_following(target), Utils.show_error_message(f"Stopped following: {message}")))
+            SignalPlotWidget.followers[id(target)] = follower
+            follower.start()
+        self.update_follow_button()
+
+    @staticmethod
+    def stop_following(target):
+        follower = SignalPlotWidget.followers.pop(id(target), None)
+        if follower is not None:
+            follower.stop()
+        for graph in SignalPlotWidget.graph_instances:
+            graph.update_follow_button()
+
+    @staticmethod
+    def graphs_showing(target):
+        # graphs currently holding the signal, or any channel of the block; signals can be
+        # moved and swapped between graphs, so this is looked up on every use
+        signals = target.signals if hasattr(target, 'signals') else [target]
+        return [graph for graph in SignalPlotWidget.graph_instances
+                if any(signal in graph.signals for signal in signals)]
+
+    @staticmethod
+    def extend_target(target, n_new):
+        """ Extends whichever graphs show the target now; returns whether any does. """
+        graphs = SignalPlotWidget.graphs_showing(target)
+        for graph in graphs:
+            graph.extend_signals(target, n_new)
+        return bool(graphs)
+
+    def extend_signals(self, target, n_new):
+        # only the new samples are looked at; curves are re-sampled from the pyramid
+        new_samples = target.data[..., -n_new:]
+        self.yMin = min(self.yMin, float(np.min(new_samples)))
+        self.yMax = max(self.yMax, float(np.max(new_samples)))
+        # samples since the start of the recording, including any dropped out of the retention window
+        n_total = int(round(target.time_axis.t0 * target.time_axis.f_sample)) + len(target.time_axis)
+        if n_total > self.max_length:
+            self.max_length = n_total
+            self.update_max_time(TimeAxis(0, target.time_axis.f_sample, self.max_length))
+        self.schedule_render(RenderScheduler.DATA)
+
+    def toggle_stream(self):
+        """ Starts/stops listening for live sample streams on local UDP/TCP ports. """
+        if self.stream_service is not None:
+            self.stream_service.stop()
+            self.stream_service = None
+            self.ports_button.setText("Ports")
+            return
+        from stream_ingest import StreamIngestService, parse_ports   # asyncio, only needed for live ports
+        text, ok = QtWidgets.QInputDialog.getText(
+            None, "Listen on ports", "Ports (e.g. udp:5000, tcp:5001):", text="udp:5000")
+        if not ok:
+            return
+        try:
+            ports = parse_ports(text)
+        except ValueError as e:
+            Utils.show_error_message(str(e))
+            return
+        if ports:
+            self.stream_service = StreamIngestService(self, ports)
+            self.stream_service.failed.connect(lambda message: (
+                self.toggle_stream(), Utils.show_error_message(f"Could not listen: {message}")))
+            self.stream_service.start()
+            self.ports_button.setText("Disconnect")
+
+    def update_follow_button(self):
+        signal = self.selected_signal
+        followed = signal is not None and id(self.follow_target(signal)) in SignalPlotWidget.followers
+        self.follow_button.setText("Unfollow" if followed else "Follow")
+        self.follow_button.setEnabled(signal is not None and signal.source is not None)
 
     def update_max_time(self, new_max_time):
         self.max_time_axis = new_max_time
 
+    def current_window_range(self):
+        # time span (start, end) of the current playback window on the max time axis
+        last_index = len(self.max_time_axis) - 1
+        start = min(self.window_start, last_index)
+        end = min(max(self.window_end - 1, start), last_index)
+        return self.max_time_axis[start], self.max_time_axis[end]
+
     def get_global_min_and_max(self):
-        #minimum and maximum values from signal's data
-        min_values = [np.min(signal.data) for signal in self.signals]
-        max_values = [np.max(signal.data) for signal in self.signals]
+        #minimum and maximum values from each signal's cached statistics, or None if all are empty
+        statistics = [signal.statistics() for signal in self.signals]
+        statistics = [signal_statistics for signal_statistics in statistics if signal_statistics.count]
+        if not statistics:
+            return None
+        min_values = [float(signal_statistics.min) for signal_statistics in statistics]
+        max_values = [float(signal_statistics.max) for signal_statistics in statistics]
         
         #global minimum and maximum values across all signals
         global_min = min(min_values)
@@ -428,11 +594,20 @@ class SignalPlotWidget():
                     self.play_pause_signal()
                 
             self.signals.remove(self.selected_signal)
+            target = self.follow_target(self.selected_signal)
+            if not self.graphs_showing(target):
+                SignalPlotWidget.stop_following(target)
             self.update_graph()
 
     def clear_graph(self):
+        if self.stream_service is not None:
+            self.toggle_stream()
         self.selected_signal = None
         self.signals = []
+        # files of signals that are still on the other graph keep being followed
+        for follower in list(SignalPlotWidget.followers.values()):
+            if not self.graphs_showing(follower.target):
+                SignalPlotWidget.stop_following(follower.target)
         self.update_graph()
 
     def enable_buttons(self):
@@ -444,6 +619,7 @@ class SignalPlotWidget():
         self.statistics_button.setEnabled(enable)
         self.zoom_in_button.setEnabled(enable)
         self.zoom_out_button.setEnabled(enable)
+        self.update_follow_button()
         if not enable:
             self.title_input.setText('')
         else:
@@ -0,0 +1,99 @@
+import numpy as np
+from sample_buffer import SampleBuffer
+
+
+class MinMaxPyramid():
+    """ Level-of-detail pyramid of per-block (min, max) pairs over a 1-D signal.
+    Level k summarizes blocks of FACTOR**k samples. Levels are built lazily, the first
+    time a zoom level needs them, and extended incrementally when the signal grows. """
+
+    FACTOR = 4
+    POINTS_PER_PIXEL = 2
+
+    def __init__(self):
+        self.n_indexed = 0
+        # per level: [mins, maxs, number of complete blocks]; mins/maxs are SampleBuffers so
+        # a growing signal only appends the new blocks
+        self.levels = []
+
+    def block_size(self, level):
+        return MinMaxPyramid.FACTOR ** level
+
+    def reset(self):
+        self.n_indexed = 0
+        self.levels = []
+
+    def update(self, data, max_level):
+        """ Brings levels 1..max_level up to date with data (which may have grown). """
+        n = len(data)
+        if n < self.n_indexed:
+            self.reset()   # data was replaced or trimmed, rebuild from scratch
+        self.n_indexed = n
+
+        for level in range(1, max_level + 1):
+            if level > len(self.levels):
+                self.levels.append([SampleBuffer(data.dtype), SampleBuffer(data.dtype), 0])
+            mins, maxs, n_blocks = self.levels[level - 1]
+            total_blocks = n // self.block_size(level)
+            if total_blocks == n_blocks:
+                continue
+
+            if level == 1:
+                source = np.asarray(data[n_blocks * MinMaxPyramid.FACTOR:total_blocks * MinMaxPyramid.FACTOR])
+                new_mins = source.reshape(-1, MinMaxPyramid.FACTOR).min(axis=1)
+                new_maxs = source.reshape(-1, MinMaxPyramid.FACTOR).max(axis=1)
+            else:
+                # each block is FACTOR complete blocks of the level below
+                lower_mins, lower_maxs, _ = self.levels[level - 2]
+                lo, hi = n_blocks * MinMaxPyramid.FACTOR, total_blocks * MinMaxPyramid.FACTOR
+                new_mins = lower_mins.view()[lo:hi].reshape(-1, MinMaxPyramid.FACTOR).min(axis=1)
+                new_maxs = lower_maxs.view()[lo:hi].reshape(-1, MinMaxPyramid.FACTOR).max(axis=1)
+
+            mins.extend(new_mins)
+            maxs.extend(new_maxs)
+            self.levels[level - 1][2] = total_blocks
+
+    def pick_level(self, n_samples, pixels):
+        # coarsest detail that still gives about POINTS_PER_PIXEL points per pixel
+        # (every block contributes two points, its min and its max)
+        level = 0
+        while (self.block_size(level + 1) <= n_samples and
+               n_samples / self.block_size(level + 1) * 2 >= pixels * MinMaxPyramid.POINTS_PER_PIXEL):
+            level += 1
+        return level
+
+    def render_data(self, data, time_axis, x_min, x_max, pixels):
+        """ Returns (x, y) arrays for the samples between x_min and x_max, decimated
+        to about POINTS_PER_PIXEL points per pixel of a plot `pixels` wide. """
+        n = len(data)
+        if n == 0:
+            return np.empty(0), np.empty(0)
+        # one extra sample on each side so the curve reaches the edges of the range
+        start = max(time_axis.searchsorted(x_min, 'right') - 1, 0)
+        stop = max(min(time_axis.searchsorted(x_max, 'left') + 1, n), start)
+
+        level = self.pick_level(stop - start, max(int(pixels), 1))
+        if level == 0:
+            return time_axis[start:stop], np.asarray(data[start:stop])
+
+        self.update(data, level)
+        block = self.block_size(level)
+        mins, maxs, n_blocks = self.levels[level - 1]
+        first, last = start // block, -(-stop // block)
+        block_mins = mins.view()[first:min(last, n_blocks)]
+        block_maxs = maxs.view()[first:min(last, n_blocks)]
+        if last > n_blocks:
+            # trailing samples that do not fill a complete block yet
+            tail = np.asarray(data[max(n_blocks * block, start):stop])
+            if len(tail):
+                block_mins = np.append(block_mins, tail.min())
+                block_maxs = np.append(block_maxs, tail.max())
+
+        y = np.empty(2 * len(block_mins), dtype=block_mins.dtype)
+        y[0::2] = block_mins
+        y[1::2] = block_maxs
+        block_starts = (first + np.arange(len(block_mins))) * block
+        x = np.empty(len(y))
+        x[0::2] = time_axis.t0 + block_starts * time_axis.dt
+        x[1::2] = time_axis.t0 + (block_starts + block / 2) * time_axis.dt
+        return x, y
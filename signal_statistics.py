@@ -0,0 +1,68 @@
+import numpy as np
+
+# values reduced per chunk, across all channels: the chunk stays in cache while its mean,
+# squared deviations, min and max are taken, and no full-size temporary is ever allocated
+CHUNK_VALUES = 1 << 16
+
+
+class SignalStatistics():
+    """ Running count, mean, variance, min and max of a signal, or of every channel of a
+    channel-major (n_channels, n) block along its last axis.
+    Samples are reduced chunk by chunk and each chunk is merged into the running values
+    with Chan et al.'s parallel form of Welford's update, so appending samples only costs
+    the new samples, and memory-mapped recordings are read once, in order. """
+
+    def __init__(self, shape=()):
+        self.count = 0
+        self.mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)   # sum of squared deviations from the mean
+        self.min = np.full(shape, np.inf)
+        self.max = np.full(shape, -np.inf)
+
+    @classmethod
+    def of(cls, data):
+        data = np.asarray(data)
+        return cls(data.shape[:-1]).update(data)
+
+    @property
+    def variance(self):
+        # population variance, like np.var / np.std with the default ddof=0
+        return self.m2 / self.count if self.count else np.full(np.shape(self.m2), np.nan)
+
+    @property
+    def std(self):
+        return np.sqrt(self.variance)
+
+    def update(self, samples):
+        """ Adds samples of shape (k,), or (n_channels, k) for a block; returns self. """
+        samples = np.asarray(samples)
+        chunk_size = max(CHUNK_VALUES // max(int(np.prod(samples.shape[:-1])), 1), 1)
+        for start in range(0, samples.shape[-1], chunk_size):
+            self.merge(samples[..., start:start + chunk_size])
+        return self
+
+    def merge(self, chunk):
+        chunk = np.asarray(chunk, dtype=np.float64)
+        n = chunk.shape[-1]
+        if n == 0:
+            return
+        mean = chunk.mean(axis=-1)
+        m2 = np.square(chunk - mean[..., None]).sum(axis=-1)
+        total = self.count + n
+        delta = mean - self.mean
+        self.mean = self.mean + delta * (n / total)
+        self.m2 = self.m2 + m2 + delta ** 2 * (self.count * n / total)
+        self.min = np.minimum(self.min, chunk.min(axis=-1))
+        self.max = np.maximum(self.max, chunk.max(axis=-1))
+        self.count = total
+
+    def channel(self, index):
+        """ The statistics of one channel of a block. """
+        statistics = SignalStatistics()
+        statistics.count = self.count
+        statistics.mean, statistics.m2 = self.mean[index], self.m2[index]
+        statistics.min, statistics.max = self.min[index], self.max[index]
+        return statistics
+
+    def __repr__(self):
+        return f"SignalStatistics(count={self.count}, mean={self.mean}, std={self.std}, min={self.min}, max={self.max})"
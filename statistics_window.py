@@ -1,6 +1,6 @@
-import numpy as np
 from PyQt5 import QtWidgets
 from pyqtgraph import PlotWidget
+from render_model import RenderModel
 
 class StatisticsWindow(QtWidgets.QWidget):
     def __init__(self, signal, title, color, actual_signal):
@@ -19,7 +19,13 @@ class StatisticsWindow(QtWidgets.QWidget):
         
         self.plot_widget = PlotWidget()
         self.plot_widget.setBackground('#001414')
-        self.plot_widget.plot(self.actual_signal.time_axis,self.signal, pen=self.color)
+        # the curve is decimated from the signal's pyramid for the visible range, like the main graphs
+        self.render_model = RenderModel(self.plot_widget)
+        self.render_model.sync([self.actual_signal], None)
+        time_axis = self.actual_signal.time_axis
+        if len(time_axis):
+            self.render_model.update_data((time_axis.start, time_axis.end), self.plot_width())
+        self.plot_widget.plotItem.vb.sigXRangeChanged.connect(self.refresh_curve)
         self.plot_widget.setTitle(self.title)
         layout.addWidget(self.plot_widget)
 
@@ -93,6 +99,14 @@ class StatisticsWindow(QtWidgets.QWidget):
 
         self.update_statistics()
 
+    def plot_width(self):
+        # width of the plot area in pixels (fallback before the window is laid out)
+        return int(self.plot_widget.plotItem.vb.width()) or 1000
+
+    def refresh_curve(self):
+        # re-pick the level of detail when zooming/panning
+        self.render_model.update_data(tuple(self.plot_widget.viewRange()[0]), self.plot_width())
+
         #calc. &  update all statistics in the labels
     def update_statistics(self):
         self.result_labels[0].setText(f"{self.calculate_mean():.2f}")
@@ -103,19 +117,20 @@ class StatisticsWindow(QtWidgets.QWidget):
         self.result_labels[5].setText(f"{self.calculate_sampling_rate()} Hz")
 
     def calculate_mean(self):
-        return np.mean(self.signal)
+        # cached on the signal, one pass for all four values
+        return self.actual_signal.statistics().mean
 
     def calculate_std(self):
-        return np.std(self.signal)
+        return self.actual_signal.statistics().std
 
     def calculate_duration(self):
         return len(self.signal)*1000/self.actual_signal.f_sample
 
     def calculate_min(self):
-        return np.min(self.signal)
+        return self.actual_signal.statistics().min
 
     def calculate_max(self):
-        return np.max(self.signal)
+        return self.actual_signal.statistics().max
 
     def calculate_sampling_rate(self):
         return self.actual_signal.f_sample
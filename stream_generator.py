@@ -0,0 +1,56 @@
+import argparse
+import asyncio
+import time
+from stream_protocol import pack_frame
+from synthetic_signals import KINDS, SyntheticWorkload
+
+
+async def send(kind, port, host, workload, frame_ms, duration):
+    f_sample = workload.f_sample
+    frame_samples = max(int(f_sample * frame_ms / 1000), 1)
+    if kind == 'udp':
+        transport, _ = await asyncio.get_running_loop().create_datagram_endpoint(
+            asyncio.DatagramProtocol, remote_addr=(host, port))
+        write = transport.sendto
+    else:
+        _, writer = await asyncio.open_connection(host, port)
+        write = writer.write
+
+    start_time = time.perf_counter()
+    sequence = 0
+    while duration is None or time.perf_counter() - start_time < duration:
+        # send every frame that is due by now, then sleep until the next one
+        due = int((time.perf_counter() - start_time) * f_sample / frame_samples)
+        while sequence < due:
+            samples = workload.block(sequence * frame_samples, frame_samples)
+            write(pack_frame(samples, f_sample, sequence))
+            sequence += 1
+        if kind == 'tcp':
+            await writer.drain()
+        await asyncio.sleep(frame_ms / 1000)
+
+
+async def main(arguments):
+    # one workload per port (seeded by the port), so every port carries different signals
+    def workload(port):
+        return SyntheticWorkload(arguments.channels, arguments.rate, arguments.kind, seed=port)
+    senders = [send('udp', port, arguments.host, workload(port), arguments.frame_ms, arguments.duration)
+               for port in arguments.udp]
+    senders += [send('tcp', port, arguments.host, workload(port), arguments.frame_ms, arguments.duration)
+                for port in arguments.tcp]
+    await asyncio.gather(*senders)
+
+
+if __name__ == '__main__':
+    # sends synthetic sample streams to the viewer's "Ports" inputs, e.g.
+    #   python stream_generator.py --udp 5000 5001 --tcp 5002 --channels 8 --rate 2000
+    parser = argparse.ArgumentParser(description="Local test source for the multi-port stream ingest.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--udp', type=int, nargs='*', default=[5000])
+    parser.add_argument('--tcp', type=int, nargs='*', default=[])
+    parser.add_argument('--channels', type=int, default=1)
+    parser.add_argument('--rate', type=float, default=1000, help="samples per second per channel")
+    parser.add_argument('--kind', choices=KINDS + ('mixed',), default='mixed', help="kind of synthetic signal")
+    parser.add_argument('--frame-ms', type=float, default=10, help="milliseconds of samples per frame")
+    parser.add_argument('--duration', type=float, default=None, help="seconds to send (default: forever)")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,177 @@
+import asyncio
+import threading
+import numpy as np
+from PyQt5 import QtCore
+from stream_protocol import FRAME_HEADER, parse_header, payload_size, unpack_frames
+from utils import Utils
+
+
+def parse_ports(text):
+    """ "udp:5000, tcp:5001, 5002" -> [('udp', 5000), ('tcp', 5001), ('udp', 5002)] """
+    ports = []
+    for item in text.replace(';', ',').split(','):
+        item = item.strip().lower()
+        if not item:
+            continue
+        kind, _, port = item.rpartition(':')
+        kind = kind or 'udp'
+        if kind not in ('udp', 'tcp') or not port.isdigit():
+            raise ValueError(f"Invalid port '{item}', expected udp:<port> or tcp:<port>.")
+        ports.append((kind, int(port)))
+    return ports
+
+
+class PortStream():
+    """ Samples received on one port. The network thread feeds frames in, the GUI thread
+    takes whatever arrived since its last visit; the lock is only held to swap a list. """
+
+    def __init__(self, kind, port):
+        self.name = f"{kind}:{port}"
+        self.lock = threading.Lock()
+        self.pending = []
+        self.channels = None
+        self.f_sample = None
+        self.next_sequence = None
+        self.lost_frames = 0
+        self.target = None    # Signal or ChannelBlock showing this port, created on the GUI thread
+
+    def feed(self, data):
+        # network thread
+        for channels, f_sample, sequence, samples in unpack_frames(data):
+            if self.channels is None:
+                self.channels, self.f_sample = channels, f_sample
+            elif channels != self.channels:
+                continue   # a sender with another layout on the same port
+            if self.next_sequence is not None and sequence != self.next_sequence:
+                self.lost_frames += (sequence - self.next_sequence) & 0xFFFFFFFF
+            self.next_sequence = (sequence + 1) & 0xFFFFFFFF
+            with self.lock:
+                self.pending.append(samples)
+
+    def take(self):
+        # GUI thread: (n, channels) rows received since the last call, or None
+        with self.lock:
+            chunks, self.pending = self.pending, []
+        if not chunks:
+            return None
+        return chunks[0] if len(chunks) == 1 else np.concatenate(chunks)
+
+
+class UdpStreamProtocol(asyncio.DatagramProtocol):
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def datagram_received(self, data, address):
+        try:
+            self.stream.feed(data)
+        except ValueError:
+            pass   # not one of our frames
+
+
+class StreamIngestService(QtCore.QObject):
+    """ Listens on local UDP/TCP ports for framed sample streams (see stream_protocol).
+    Sockets are served by an asyncio event loop on a background thread; the GUI thread
+    drains the received samples a few times per frame into one ring-buffered Signal (or
+    ChannelBlock, for multi-channel streams) per port, so the Qt event loop never waits
+    on the network. """
+
+    failed = QtCore.pyqtSignal(str)
+
+    drain_interval = 30   # ms
+    retention = 60        # seconds kept per port
+
+    def __init__(self, plot, ports, host='127.0.0.1'):
+        super().__init__()
+        self.plot = plot
+        self.host = host
+        self.ports = ports
+        self.streams = [PortStream(kind, port) for kind, port in ports]
+        self.loop = None
+        self.stopping = asyncio.Event()
+        self.thread = None
+        self.timer = QtCore.QTimer()
+        self.timer.timeout.connect(self.drain)
+
+    def start(self):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.run, name="stream-ingest", daemon=True)
+        self.thread.start()
+        self.timer.start(StreamIngestService.drain_interval)
+        return self
+
+    def stop(self):
+        self.timer.stop()
+        if self.thread is not None and self.thread.is_alive():
+            self.loop.call_soon_threadsafe(self.stopping.set)
+            self.thread.join(timeout=2)
+        self.thread = None
+
+    def is_running(self):
+        return self.thread is not None and self.thread.is_alive()
+
+    def run(self):
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self.serve())
+        except OSError as e:
+            self.failed.emit(str(e))   # e.g. port already in use
+        finally:
+            self.loop.close()
+
+    async def serve(self):
+        servers, transports = [], []
+        try:
+            for (kind, port), stream in zip(self.ports, self.streams):
+                if kind == 'udp':
+                    transport, _ = await self.loop.create_datagram_endpoint(
+                        lambda stream=stream: UdpStreamProtocol(stream), local_addr=(self.host, port))
+                    transports.append(transport)
+                else:
+                    servers.append(await asyncio.start_server(
+                        lambda reader, writer, stream=stream: self.read_tcp(stream, reader, writer),
+                        self.host, port))
+            await self.stopping.wait()
+        finally:
+            for transport in transports:
+                transport.close()
+            for server in servers:
+                server.close()
+                await server.wait_closed()
+
+    async def read_tcp(self, stream, reader, writer):
+        try:
+            while True:
+                header = await reader.readexactly(FRAME_HEADER.size)
+                channels, _, _, n_samples = parse_header(header)
+                payload = await reader.readexactly(payload_size(channels, n_samples))
+                stream.feed(header + payload)
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass   # sender went away, or is not speaking our protocol
+        finally:
+            writer.close()
+
+    def drain(self):
+        # GUI thread: move what arrived into the ring buffers and extend the graph once
+        for stream in self.streams:
+            rows = stream.take()
+            if rows is None:
+                continue
+            created = stream.target is None
+            if created:
+                stream.target = self.create_target(stream)
+            elif not self.plot.graphs_showing(stream.target):
+                continue   # deleted from the graphs: its samples are dropped
+            stream.target.append(rows if stream.channels > 1 else rows[:, 0])
+            # the port's signal may have been moved to the other graph since
+            self.plot.extend_target(stream.target, len(rows))
+            if created:
+                self.plot.update_graph()
+
+    def create_target(self, stream):
+        shape = (0,) if stream.channels == 1 else (0, stream.channels)
+        signals = Utils.add_signal(self.plot, np.empty(shape, dtype=np.float32), stream.f_sample,
+                                   stream.name, update=False)
+        target = signals[0].block if signals[0].block is not None else signals[0]
+        target.retention = StreamIngestService.retention
+        return target
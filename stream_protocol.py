@@ -0,0 +1,46 @@
+import struct
+import numpy as np
+
+# framed binary sample stream, as sent to the ingest ports (one or more frames per UDP
+# datagram, back to back on a TCP connection):
+# header = magic, channel count, sampling rate, sequence number, samples per channel,
+# followed by n_samples rows of `channels` little-endian float32 values
+MAGIC = b'MSVF'
+FRAME_HEADER = struct.Struct('<4sHdII')
+SAMPLE_DTYPE = np.dtype('<f4')
+
+
+def pack_frame(samples, f_sample, sequence):
+    """ Frames samples of shape (n,) or (n, channels). """
+    samples = np.asarray(samples, dtype=SAMPLE_DTYPE)
+    channels = 1 if samples.ndim == 1 else samples.shape[1]
+    header = FRAME_HEADER.pack(MAGIC, channels, float(f_sample), sequence & 0xFFFFFFFF, len(samples))
+    return header + samples.tobytes()
+
+
+def parse_header(header):
+    """ Returns (channels, f_sample, sequence, n_samples) of the header a frame starts with. """
+    if len(header) < FRAME_HEADER.size:
+        raise ValueError("Truncated sample stream frame.")
+    magic, channels, f_sample, sequence, n_samples = FRAME_HEADER.unpack_from(header)
+    if magic != MAGIC or channels == 0 or f_sample <= 0:
+        raise ValueError("Not a sample stream frame.")
+    return channels, f_sample, sequence, n_samples
+
+
+def payload_size(channels, n_samples):
+    return channels * n_samples * SAMPLE_DTYPE.itemsize
+
+
+def unpack_frames(data):
+    """ Yields (channels, f_sample, sequence, samples (n, channels)) for every frame in data. """
+    offset = 0
+    while offset < len(data):
+        channels, f_sample, sequence, n_samples = parse_header(data[offset:offset + FRAME_HEADER.size])
+        offset += FRAME_HEADER.size
+        size = payload_size(channels, n_samples)
+        if offset + size > len(data):
+            raise ValueError("Truncated sample stream frame.")
+        samples = np.frombuffer(data, dtype=SAMPLE_DTYPE, count=channels * n_samples, offset=offset)
+        yield channels, f_sample, sequence, samples.reshape(n_samples, channels)
+        offset += size
@@ -0,0 +1,158 @@
+import argparse
+import os
+import time
+import numpy as np
+from binary_signal import write_header
+
+# samples per channel generated at once: large enough for NumPy to dominate, small enough
+# that a block of a few hundred channels stays in the tens of megabytes
+CHUNK_SAMPLES = 16384
+
+KINDS = ('ecg', 'eeg', 'emg')
+
+
+class SyntheticWorkload():
+    """ Many channels of ECG/EEG/EMG-like test signals of any length and sampling rate.
+    Every channel is a mix of sinusoids, noise, spikes and a slow baseline drift, with
+    parameters drawn once from `seed`. Blocks are computed for all channels at once from
+    absolute sample indices, so consecutive chunks join up seamlessly and a recording of
+    any size can be produced chunk by chunk, to memory, a CSV or .bin file, or a port.
+    `kind` is one of KINDS, or 'mixed' to cycle through them across the channels. """
+
+    def __init__(self, channels=8, f_sample=1000, kind='mixed', seed=0):
+        if kind != 'mixed' and kind not in KINDS:
+            raise ValueError(f"Unknown signal kind '{kind}', expected one of {', '.join(KINDS)} or mixed.")
+        self.channels = channels
+        self.f_sample = float(f_sample)
+        self.kinds = [KINDS[i % len(KINDS)] if kind == 'mixed' else kind for i in range(channels)]
+        self.rng = np.random.default_rng(seed)
+        self.components = [self.draw(kind) for kind in self.kinds]
+
+        # per channel parameters as (channels,) rows, so a block is a few broadcast operations
+        def column(key):
+            return np.array([component[key] for component in self.components])
+        self.frequencies, self.amplitudes, self.phases = column('frequencies'), column('amplitudes'), column('phases')
+        self.noise = column('noise')
+        self.beat_rate, self.beat_amplitude, self.beat_width = column('beat_rate'), column('beat_amplitude'), column('beat_width')
+        self.spike_rate, self.spike_amplitude = column('spike_rate'), column('spike_amplitude')
+        self.burst_rate, self.burst_depth = column('burst_rate'), column('burst_depth')
+        self.drift_frequency, self.drift_amplitude = column('drift_frequency'), column('drift_amplitude')
+        self.offsets = self.rng.uniform(0, 1, channels)   # phase of beats and bursts
+
+        # sinusoids above Nyquist would only alias into noise
+        self.amplitudes[self.frequencies >= self.f_sample / 2] = 0
+
+    def draw(self, kind):
+        uniform = self.rng.uniform
+        component = {'beat_rate': 0.0, 'beat_amplitude': 0.0, 'beat_width': 0.05, 'spike_rate': 0.0,
+                     'spike_amplitude': 0.0, 'burst_rate': 0.0, 'burst_depth': 0.0,
+                     'drift_frequency': uniform(0.02, 0.3), 'phases': uniform(0, 2 * np.pi, 3)}
+        if kind == 'ecg':
+            # heart beat: sharp QRS pulse at 50-100 bpm, with P/T-wave-like harmonics
+            heart_rate = uniform(0.8, 1.7)
+            component.update(frequencies=heart_rate * np.array([1, 2, 3]), amplitudes=[0.15, 0.1, 0.05],
+                             noise=0.02, beat_rate=heart_rate, beat_amplitude=uniform(0.8, 1.2),
+                             beat_width=uniform(0.02, 0.04), drift_amplitude=uniform(0.05, 0.2))
+        elif kind == 'eeg':
+            # theta, alpha and beta rhythms in background noise, with rare epileptiform spikes
+            component.update(frequencies=[uniform(4, 8), uniform(8, 13), uniform(13, 30)],
+                             amplitudes=[uniform(0.2, 0.4), uniform(0.3, 0.6), uniform(0.05, 0.15)],
+                             noise=0.2, spike_rate=uniform(0.05, 0.3), spike_amplitude=uniform(1.5, 3),
+                             drift_amplitude=uniform(0.1, 0.3))
+        else:
+            # muscle activity: broadband noise in contraction bursts, and some mains hum
+            component.update(frequencies=[50, uniform(60, 150), uniform(150, 250)],
+                             amplitudes=[0.05, uniform(0.05, 0.1), uniform(0.02, 0.05)],
+                             noise=uniform(0.3, 0.6), burst_rate=uniform(0.2, 1), burst_depth=uniform(0.6, 0.9),
+                             drift_amplitude=uniform(0.01, 0.05))
+        component['frequencies'] = np.asarray(component['frequencies'], dtype=np.float64)
+        component['amplitudes'] = np.asarray(component['amplitudes'], dtype=np.float64)
+        return component
+
+    def block(self, start, n_samples, dtype=np.float64):
+        """ Samples start..start + n_samples as an (n_samples, channels) array. Noise comes
+        from the workload's own generator, so blocks are meant to be taken in order. """
+        t = ((start + np.arange(n_samples)) / self.f_sample)[:, None]
+        samples = self.noise * self.rng.standard_normal((n_samples, self.channels))
+
+        # bursts gate the noise: a smooth on/off envelope per channel (EMG)
+        bursts = self.burst_rate > 0
+        if bursts.any():
+            envelope = 0.5 + 0.5 * np.sin(2 * np.pi * (self.burst_rate * t + self.offsets))
+            samples *= 1 - self.burst_depth * (1 - envelope ** 4)
+
+        for k in range(self.frequencies.shape[1]):
+            samples += self.amplitudes[:, k] * np.sin(2 * np.pi * self.frequencies[:, k] * t + self.phases[:, k])
+
+        # periodic beats: a narrow gaussian at the same point of every cycle (ECG)
+        if (self.beat_amplitude > 0).any():
+            cycle = (self.beat_rate * t + self.offsets) % 1.0 - 0.5
+            width = np.maximum(self.beat_width * self.beat_rate, 1e-6)   # seconds -> fraction of a cycle
+            samples += self.beat_amplitude * np.exp(-0.5 * (cycle / width) ** 2)
+
+        # random spikes, a Poisson process per channel (EEG)
+        if (self.spike_rate > 0).any():
+            hits = self.rng.random((n_samples, self.channels)) < self.spike_rate / self.f_sample
+            samples += hits * self.spike_amplitude * np.sign(self.rng.standard_normal((n_samples, self.channels)))
+
+        samples += self.drift_amplitude * np.sin(2 * np.pi * self.drift_frequency * t + self.phases[:, 0])
+        return samples.astype(dtype, copy=False)
+
+    def chunks(self, n_samples=None, chunk_size=CHUNK_SAMPLES, dtype=np.float64):
+        """ Yields consecutive blocks of at most chunk_size samples; forever if n_samples is None. """
+        start = 0
+        while n_samples is None or start < n_samples:
+            size = chunk_size if n_samples is None else min(chunk_size, n_samples - start)
+            yield self.block(start, size, dtype)
+            start += size
+
+    def generate(self, n_samples, dtype=np.float64, chunk_size=CHUNK_SAMPLES):
+        """ The whole recording in memory: (n_samples,) for one channel, else (n_samples, channels). """
+        data = np.empty((n_samples, self.channels), dtype=dtype)
+        start = 0
+        for chunk in self.chunks(n_samples, chunk_size, dtype):
+            data[start:start + len(chunk)] = chunk
+            start += len(chunk)
+        return data[:, 0] if self.channels == 1 else data
+
+    def write_csv(self, file_name, n_samples, chunk_size=CHUNK_SAMPLES):
+        # the app's CSV layout: sampling rate on line 1, then one comma separated row per sample
+        with open(file_name, mode='w') as file:
+            file.write(f"{self.f_sample:g}\n")
+            for chunk in self.chunks(n_samples, chunk_size):
+                np.savetxt(file, chunk, fmt='%.6E', delimiter=',')
+
+    def write_binary(self, file_name, n_samples, dtype='<f4', chunk_size=CHUNK_SAMPLES):
+        # self-describing .bin recording (see binary_signal), written chunk by chunk
+        with open(file_name, 'wb') as file:
+            write_header(file, dtype, self.channels, self.f_sample)
+            for chunk in self.chunks(n_samples, chunk_size, np.dtype(dtype)):
+                chunk.tofile(file)
+
+
+if __name__ == '__main__':
+    # writes a recording of production size, e.g. ten minutes of 64 channels at 2 kHz:
+    #   python synthetic_signals.py load.bin --channels 64 --rate 2000 --seconds 600
+    # (see stream_generator.py to send the same signals to the "Ports" inputs)
+    parser = argparse.ArgumentParser(description="Writes synthetic ECG/EEG/EMG-like recordings for load testing.")
+    parser.add_argument('file', help="output file, .csv or .bin")
+    parser.add_argument('--channels', type=int, default=8)
+    parser.add_argument('--rate', type=float, default=1000, help="samples per second per channel")
+    parser.add_argument('--seconds', type=float, default=60)
+    parser.add_argument('--kind', choices=KINDS + ('mixed',), default='mixed')
+    parser.add_argument('--seed', type=int, default=0)
+    arguments = parser.parse_args()
+
+    workload = SyntheticWorkload(arguments.channels, arguments.rate, arguments.kind, arguments.seed)
+    n_samples = int(arguments.seconds * arguments.rate)
+    extension = os.path.splitext(arguments.file)[1].lower()
+    start = time.perf_counter()
+    if extension == '.csv':
+        workload.write_csv(arguments.file, n_samples)
+    elif extension == '.bin':
+        workload.write_binary(arguments.file, n_samples)
+    else:
+        parser.error("The output file must be .csv or .bin.")
+    elapsed = time.perf_counter() - start
+    megabytes = os.path.getsize(arguments.file) / 1024 / 1024
+    print(f"{n_samples} samples x {arguments.channels} channels, {megabytes:.1f} MB in {elapsed:.2f} s")
@@ -0,0 +1,28 @@
+import os
+import sys
+import pytest
+
+# the modules live flat at the repository root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope='session')
+def application():
+    # one QApplication, kept alive for the whole session: Qt objects outlive a single test
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    QtWidgets = pytest.importorskip('PyQt5.QtWidgets')
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def app(application, monkeypatch):
+    """ A main window whose two graphs are registered afresh. """
+    from main import SignalApp
+    from signal_plot_widget import SignalPlotWidget
+    # the graphs pair up through class-wide registries, one window per process
+    monkeypatch.setattr(SignalPlotWidget, 'graph_instances', [])
+    monkeypatch.setattr(SignalPlotWidget, 'followers', {})
+    window = SignalApp()
+    yield window
+    window.first_graph.clear_graph()
+    window.second_graph.clear_graph()
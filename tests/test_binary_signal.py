@@ -0,0 +1,66 @@
+import json
+import numpy as np
+import pytest
+from binary_signal import HEADER_SIZE, open_binary_signal, read_header, write_binary_signal
+
+
+@pytest.mark.parametrize('shape', [(1000,), (1000, 1), (250, 8)])
+@pytest.mark.parametrize('dtype', ['<f4', '<f8', '<i2'])
+def test_header_round_trip(tmp_path, shape, dtype):
+    file_name = str(tmp_path / 'signal.bin')
+    samples = (np.random.default_rng(0).standard_normal(shape) * 100).astype(dtype)
+    write_binary_signal(file_name, samples, 512.5, dtype=dtype)
+
+    assert read_header(file_name) == (np.dtype(dtype), 1 if len(shape) == 1 else shape[1], 512.5, HEADER_SIZE)
+    data, f_sample = open_binary_signal(file_name)
+    assert isinstance(data, np.memmap) and f_sample == 512.5
+    expected = samples if len(shape) == 1 or shape[1] > 1 else samples[:, 0]
+    np.testing.assert_array_equal(data, expected)
+
+
+def test_header_only_file_is_empty(tmp_path):
+    file_name = str(tmp_path / 'empty.bin')
+    write_binary_signal(file_name, np.empty((0, 4)), 100)
+    data, f_sample = open_binary_signal(file_name)
+    assert data.shape == (0, 4) and f_sample == 100
+
+    write_binary_signal(file_name, np.empty(0), 100)
+    data, _ = open_binary_signal(file_name)
+    assert data.shape == (0,)
+
+
+def test_zero_channels_are_rejected(tmp_path):
+    file_name = str(tmp_path / 'none.bin')
+    write_binary_signal(file_name, np.empty((0, 0)), 100)
+    with pytest.raises(ValueError, match="no channels"):
+        open_binary_signal(file_name)
+
+
+def test_partial_trailing_frame_is_ignored(tmp_path):
+    # e.g. a recording that is still being written
+    file_name = tmp_path / 'growing.bin'
+    write_binary_signal(str(file_name), np.arange(12, dtype='<f4').reshape(4, 3), 10)
+    with open(file_name, 'ab') as file:
+        file.write(b'\x00' * 5)
+    data, _ = open_binary_signal(str(file_name))
+    np.testing.assert_array_equal(data, np.arange(12).reshape(4, 3))
+
+
+def test_headerless_file_with_sidecar(tmp_path):
+    file_name = tmp_path / 'raw.bin'
+    samples = np.arange(20, dtype='<i2').reshape(10, 2)
+    file_name.write_bytes(b'JUNK' + samples.tobytes())
+    (tmp_path / 'raw.bin.json').write_text(json.dumps({'dtype': 'int16', 'channels': 2, 'f_sample': 300,
+                                                       'offset': 4}))
+    data, f_sample = open_binary_signal(str(file_name))
+    assert f_sample == 300
+    np.testing.assert_array_equal(data, samples)
+
+
+def test_headerless_file_defaults_to_float32_mono(tmp_path):
+    file_name = tmp_path / 'raw.bin'
+    samples = np.linspace(0, 1, 16, dtype='<f4')
+    file_name.write_bytes(samples.tobytes())
+    data, f_sample = open_binary_signal(str(file_name))
+    assert f_sample == 1
+    np.testing.assert_array_equal(data, samples)
@@ -0,0 +1,74 @@
+import io
+import numpy as np
+import pytest
+from csv_ingest import parse_values, read_rate_csv
+
+
+def write_csv(tmp_path, body, name='signal.csv'):
+    file_name = tmp_path / name
+    file_name.write_text(body)
+    return str(file_name)
+
+
+def genfromtxt(body):
+    # the import path csv_ingest replaced
+    return np.genfromtxt(io.StringIO(body.split('\n', 1)[1]), delimiter=',')
+
+
+@pytest.mark.parametrize('chunk_bytes', [1, 7, 64, 1 << 20])
+def test_single_column_matches_genfromtxt_across_chunk_boundaries(tmp_path, chunk_bytes):
+    samples = np.random.default_rng(0).standard_normal(500)
+    body = "250\n" + "".join(f"{value:.6E}\n" for value in samples)
+    data, rate = read_rate_csv(write_csv(tmp_path, body), chunk_bytes=chunk_bytes)
+    assert rate == 250
+    np.testing.assert_array_equal(data, genfromtxt(body))
+
+
+@pytest.mark.parametrize('chunk_bytes', [1, 5, 1 << 20])
+def test_multi_column_matches_genfromtxt(tmp_path, chunk_bytes):
+    rows = np.random.default_rng(1).standard_normal((200, 3))
+    body = "100\n" + "".join(",".join(f"{value:.6E}" for value in row) + "\n" for row in rows)
+    data, _ = read_rate_csv(write_csv(tmp_path, body), chunk_bytes=chunk_bytes)
+    assert data.shape == (200, 3)
+    np.testing.assert_array_equal(data, genfromtxt(body))
+
+
+@pytest.mark.parametrize('body', ["100\n1,\n2,\n", "100\n1,2\n,3\n", "100\n,,\n1,2,3\n", "100\n1, 2\r\n3 ,\r\n"])
+@pytest.mark.parametrize('chunk_bytes', [3, 1 << 20])
+def test_empty_fields_are_nan_like_genfromtxt(tmp_path, body, chunk_bytes):
+    data, _ = read_rate_csv(write_csv(tmp_path, body), chunk_bytes=chunk_bytes)
+    np.testing.assert_array_equal(data, genfromtxt(body.replace('\r', '')))
+
+
+def test_no_trailing_newline_and_blank_lines(tmp_path):
+    data, _ = read_rate_csv(write_csv(tmp_path, "100\n1\n\n2\n3"), chunk_bytes=2)
+    np.testing.assert_array_equal(data, [1, 2, 3])
+
+
+def test_empty_file_gives_empty_array(tmp_path):
+    data, rate = read_rate_csv(write_csv(tmp_path, "100\n"))
+    assert rate == 100 and data.shape == (0,)
+
+
+@pytest.mark.parametrize('chunk_bytes', [4, 1 << 20])
+def test_rows_of_other_width_raise_with_file_and_line(tmp_path, chunk_bytes):
+    file_name = write_csv(tmp_path, "100\n1,2\n3,4\n5\n6,7\n", name='ragged.csv')
+    with pytest.raises(ValueError, match=r"ragged\.csv: Line 4 has 1 fields instead of 2"):
+        read_rate_csv(file_name, chunk_bytes=chunk_bytes)
+
+
+def test_rows_that_cancel_out_are_still_rejected():
+    # same number of values overall as two proper rows, but not row by row
+    with pytest.raises(ValueError):
+        parse_values("1,2,3\n4\n", np.float64, n_columns=2)
+
+
+def test_non_numeric_text_raises(tmp_path):
+    with pytest.raises(ValueError, match="Malformed"):
+        read_rate_csv(write_csv(tmp_path, "100\n1\nx\n"))
+
+
+def test_float32(tmp_path):
+    data, _ = read_rate_csv(write_csv(tmp_path, "100\n0.1\n0.2\n"), dtype=np.float32)
+    assert data.dtype == np.float32
+    np.testing.assert_array_equal(data, np.array([0.1, 0.2], dtype=np.float32))
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('PyQt5')
+
+from utils import Utils
+
+
+def write_lines(file_name, values, mode='a'):
+    with open(file_name, mode) as file:
+        file.write(''.join(f"{value}\n" for value in values))
+
+
+def follow(app, tmp_path, values=range(150)):
+    file_name = str(tmp_path / "growing.csv")
+    write_lines(file_name, ['100'] + list(values), mode='w')
+    signal, = Utils.add_signal(app.first_graph, np.array(values, dtype=np.float64), 100, "growing",
+                               source=file_name)
+    app.first_graph.toggle_follow()
+    return file_name, signal
+
+
+def test_moved_signal_keeps_growing(app, tmp_path):
+    from signal_plot_widget import SignalPlotWidget
+    file_name, signal = follow(app, tmp_path)
+    follower = SignalPlotWidget.followers[id(signal)]
+
+    app.signal_to_be_moved, app.source_graph = signal, app.first_graph
+    app.move_signal(1)
+    write_lines(file_name, range(150, 200))
+    follower.poll()
+    assert len(signal.time_axis) == 200
+    # the graph showing it is extended, not the one it was followed from
+    assert app.second_graph.max_length == 200 and app.second_graph.yMax == 199
+    assert app.first_graph.max_length < 200
+    assert app.second_graph.follow_button.text() == "Unfollow"
+
+    # the graph it was moved to can stop it
+    app.second_graph.toggle_follow()
+    assert not follower.is_running() and not SignalPlotWidget.followers
+
+
+def test_blank_lines_are_not_read_twice(app, tmp_path):
+    from csv_ingest import read_rate_csv
+    from signal_plot_widget import SignalPlotWidget
+    file_name = str(tmp_path / "gaps.csv")
+    with open(file_name, 'w') as file:
+        file.write("100\n1\n\n2\n  \n3\n\n")
+    data, f_sample = read_rate_csv(file_name)
+    signal, = Utils.add_signal(app.first_graph, data, f_sample, "gaps", source=file_name)
+    app.first_graph.toggle_follow()
+
+    write_lines(file_name, [4, 5])
+    SignalPlotWidget.followers[id(signal)].poll()
+    np.testing.assert_array_equal(signal.data[:], [1, 2, 3, 4, 5])
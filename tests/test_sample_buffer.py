@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+from sample_buffer import SampleBuffer
+
+
+def test_growing_mono_buffer_keeps_everything():
+    buffer = SampleBuffer(capacity=4)
+    samples = np.arange(1000.0)
+    for start in range(0, 1000, 7):
+        buffer.extend(samples[start:start + 7])
+    np.testing.assert_array_equal(buffer.view(), samples)
+    assert len(buffer) == 1000 and buffer.capacity >= 1000 and buffer.dropped == 0
+
+
+def test_multi_channel_buffer_is_channel_major():
+    buffer = SampleBuffer(channels=3, capacity=2)
+    rows = np.arange(30.0).reshape(10, 3)
+    buffer.extend(rows[:4])
+    buffer.extend(rows[4:])
+    assert buffer.view().shape == (3, 10) and buffer.view()[1].flags.c_contiguous
+    np.testing.assert_array_equal(buffer.view(), rows.T)
+
+
+def test_from_data_copies_with_headroom():
+    data = np.arange(6.0).reshape(2, 3)   # channel-major
+    buffer = SampleBuffer.from_data(data, channels=2)
+    buffer.extend([[6.0, 7.0]])
+    data[0, 0] = -1
+    np.testing.assert_array_equal(buffer.view(), [[0, 1, 2, 6], [3, 4, 5, 7]])
+
+
+def test_view_is_zero_copy():
+    buffer = SampleBuffer()
+    buffer.extend([1.0, 2.0])
+    assert np.shares_memory(buffer.view(), buffer.storage)
+
+
+def test_empty_extend_and_latest():
+    buffer = SampleBuffer()
+    buffer.extend([])
+    assert len(buffer) == 0 and buffer.view().shape == (0,) and buffer.latest(10).shape == (0,)
+
+
+@pytest.mark.parametrize('batch', [1, 3, 7, 10, 25])
+def test_ring_keeps_at_least_the_retention_window(batch):
+    buffer = SampleBuffer(retention=10)
+    samples = np.arange(1000.0)
+    for start in range(0, 1000, batch):
+        buffer.extend(samples[start:start + batch])
+        kept = buffer.view()
+        assert min(10, start + batch) <= len(kept) <= buffer.capacity
+        # what is kept is always the newest samples, and `dropped` accounts for the rest
+        np.testing.assert_array_equal(kept, samples[buffer.dropped:start + batch])
+    assert buffer.capacity == 20 and buffer.dropped + len(buffer) == 1000
+
+
+def test_ring_with_a_batch_larger_than_its_capacity():
+    buffer = SampleBuffer(retention=4)
+    buffer.extend(np.arange(3.0))
+    buffer.extend(np.arange(3.0, 103.0))
+    np.testing.assert_array_equal(buffer.view(), np.arange(95.0, 103.0))
+    assert buffer.dropped == 95
+
+
+def test_multi_channel_ring():
+    buffer = SampleBuffer(channels=2, retention=5)
+    rows = np.arange(100.0).reshape(50, 2)
+    for start in range(0, 50, 4):
+        buffer.extend(rows[start:start + 4])
+    np.testing.assert_array_equal(buffer.view(), rows[buffer.dropped:].T)
+    np.testing.assert_array_equal(buffer.latest(5), rows[-5:].T)
+
+
+def test_latest_is_a_zero_copy_tail():
+    buffer = SampleBuffer(retention=100)
+    buffer.extend(np.arange(250.0))
+    np.testing.assert_array_equal(buffer.latest(30), np.arange(220.0, 250.0))
+    assert np.shares_memory(buffer.latest(30), buffer.storage)
+    np.testing.assert_array_equal(buffer.latest(10_000), buffer.view())
@@ -0,0 +1,74 @@
+import os
+import numpy as np
+import pytest
+import signal_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(signal_cache, 'CACHE_DIR', str(tmp_path / 'cache'))
+    monkeypatch.setattr(signal_cache, 'ENABLED', True)
+    return tmp_path / 'cache'
+
+
+def make_source(tmp_path, name='signal.csv', text="100\n1\n2\n"):
+    file_name = tmp_path / name
+    file_name.write_text(text)
+    return str(file_name)
+
+
+def test_store_then_load_round_trip(tmp_path, cache_dir):
+    source = make_source(tmp_path)
+    data = np.array([1.0, 2.0, 3.0])
+    assert signal_cache.load(source) is None and not signal_cache.contains(source)
+    signal_cache.store(source, data, 250)
+    assert signal_cache.contains(source)
+    cached, rate, title = signal_cache.load(source)
+    assert isinstance(cached, np.memmap) and rate == 250 and title == 'signal'
+    np.testing.assert_array_equal(cached, data)
+
+
+def test_entries_are_per_dtype(tmp_path, cache_dir):
+    source = make_source(tmp_path)
+    signal_cache.store(source, np.ones(3, dtype=np.float32), 1, dtype=np.float32)
+    assert signal_cache.contains(source, np.float32) and not signal_cache.contains(source)
+
+
+def test_edited_file_misses(tmp_path, cache_dir):
+    source = make_source(tmp_path)
+    signal_cache.store(source, np.ones(2), 100)
+    make_source(tmp_path, text="100\n1\n2\n3\n")
+    assert signal_cache.load(source) is None and not signal_cache.contains(source)
+
+
+def test_contains_does_not_touch_the_lru_order(tmp_path, cache_dir):
+    source = make_source(tmp_path)
+    signal_cache.store(source, np.ones(2), 100)
+    _, meta_path = signal_cache.entry_paths(signal_cache.cache_key(source, np.float64))
+    os.utime(meta_path, (1, 1))
+    assert signal_cache.contains(source)
+    assert os.path.getmtime(meta_path) == 1
+    signal_cache.load(source)
+    assert os.path.getmtime(meta_path) > 1
+
+
+def test_evict_removes_least_recently_used_first(tmp_path, cache_dir):
+    sources = [make_source(tmp_path, f"s{index}.csv") for index in range(3)]
+    for index, source in enumerate(sources):
+        signal_cache.store(source, np.zeros(1000), 100)
+        _, meta_path = signal_cache.entry_paths(signal_cache.cache_key(source, np.float64))
+        os.utime(meta_path, (index + 1, index + 1))
+    signal_cache.load(sources[0])   # most recently used now
+
+    entry_size = sum(os.path.getsize(path) for path in signal_cache.entry_paths(
+        signal_cache.cache_key(sources[0], np.float64)))
+    signal_cache.evict(max_bytes=2 * entry_size)
+    assert [signal_cache.contains(source) for source in sources] == [True, False, True]
+
+
+def test_disabled_cache(tmp_path, cache_dir, monkeypatch):
+    source = make_source(tmp_path)
+    monkeypatch.setattr(signal_cache, 'ENABLED', False)
+    signal_cache.store(source, np.ones(2), 100)
+    assert signal_cache.load(source) is None and not signal_cache.contains(source)
+    assert not cache_dir.exists()
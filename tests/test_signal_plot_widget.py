@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('PyQt5')
+
+from utils import Utils
+
+
+def test_empty_signals_leave_the_y_range_finite(app):
+    graph = app.first_graph
+    graph.clear_graph()
+    Utils.add_signal(graph, np.empty(0), 100, "empty")
+    graph.render()
+    assert np.isfinite(graph.plot_widget.viewRange()[1]).all()
+
+    # only the samples of non-empty signals set the range
+    Utils.add_signal(graph, np.array([2.0, 5.0]), 100, "short")
+    graph.render()
+    assert graph.get_global_min_and_max() == (2.0, 5.0)
+    assert np.isfinite([graph.yMin, graph.yMax]).all()
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from signal_model import TimeAxis
+from signal_pyramid import MinMaxPyramid
+
+FACTOR = MinMaxPyramid.FACTOR
+
+
+def naive_level(data, level):
+    block = FACTOR ** level
+    n_blocks = len(data) // block
+    blocks = data[:n_blocks * block].reshape(n_blocks, block)
+    return blocks.min(axis=1), blocks.max(axis=1)
+
+
+@pytest.mark.parametrize('n', [0, 3, 4, 63, 64, 1001])
+def test_levels_match_numpy(n):
+    data = np.random.default_rng(n).standard_normal(n)
+    pyramid = MinMaxPyramid()
+    pyramid.update(data, 4)
+    for level in range(1, 5):
+        mins, maxs, n_blocks = pyramid.levels[level - 1]
+        expected_mins, expected_maxs = naive_level(data, level)
+        assert n_blocks == len(expected_mins)
+        np.testing.assert_array_equal(mins.view(), expected_mins)
+        np.testing.assert_array_equal(maxs.view(), expected_maxs)
+
+
+def test_incremental_growth_matches_a_fresh_build():
+    data = np.random.default_rng(1).standard_normal(5000)
+    grown = MinMaxPyramid()
+    for n in (1, 17, 64, 65, 1000, 4099, 5000):
+        grown.update(data[:n], 5)
+    fresh = MinMaxPyramid()
+    fresh.update(data, 5)
+    for grown_level, fresh_level in zip(grown.levels, fresh.levels):
+        np.testing.assert_array_equal(grown_level[0].view(), fresh_level[0].view())
+        np.testing.assert_array_equal(grown_level[1].view(), fresh_level[1].view())
+        assert grown_level[2] == fresh_level[2]
+
+
+def test_shorter_data_rebuilds():
+    pyramid = MinMaxPyramid()
+    pyramid.update(np.arange(64.0), 2)
+    pyramid.update(-np.arange(16.0), 2)
+    np.testing.assert_array_equal(pyramid.levels[0][0].view(), naive_level(-np.arange(16.0), 1)[0])
+
+
+def test_render_data_keeps_the_envelope_including_the_partial_tail():
+    data = np.random.default_rng(2).standard_normal(100_003)
+    axis = TimeAxis(0, 1000, len(data))
+    x, y = MinMaxPyramid().render_data(data, axis, axis.start, axis.end, 200)
+    assert len(y) < len(data) / 10
+    assert y.min() == data.min() and y.max() == data.max()
+    assert np.all(np.diff(x) >= 0) and x[0] == 0 and x[-1] <= axis.end
+
+
+def test_render_data_of_a_range_covers_its_samples():
+    data = np.random.default_rng(3).standard_normal(50_000)
+    axis = TimeAxis(2.0, 100, len(data))
+    x, y = MinMaxPyramid().render_data(data, axis, 102.0, 302.0, 100)
+    first, last = axis.searchsorted(102.0), axis.searchsorted(302.0, 'right')
+    assert y.min() <= data[first:last].min() and y.max() >= data[first:last].max()
+
+
+def test_render_data_zoomed_in_returns_raw_samples():
+    data = np.arange(1000.0)
+    axis = TimeAxis(0, 10, len(data))
+    # plus the samples just outside the range, so the curve reaches its edges
+    x, y = MinMaxPyramid().render_data(data, axis, 10.05, 11.95, 800)
+    np.testing.assert_array_equal(y, data[100:121])
+    np.testing.assert_allclose(x, axis[100:121])
+
+
+def test_render_data_of_empty_signal():
+    x, y = MinMaxPyramid().render_data(np.empty(0), TimeAxis(0, 10, 0), 0, 1, 100)
+    assert len(x) == len(y) == 0
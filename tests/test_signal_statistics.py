@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+import signal_statistics
+from channel_block import ChannelBlock
+from signal_model import Signal
+from signal_statistics import SignalStatistics
+
+
+def assert_matches_numpy(statistics, data, axis=-1):
+    data = np.asarray(data, dtype=np.float64)
+    assert statistics.count == data.shape[axis]
+    np.testing.assert_allclose(statistics.mean, data.mean(axis=axis), rtol=1e-12)
+    np.testing.assert_allclose(statistics.variance, data.var(axis=axis), rtol=1e-9)
+    np.testing.assert_allclose(statistics.std, data.std(axis=axis), rtol=1e-9)
+    np.testing.assert_array_equal(statistics.min, data.min(axis=axis))
+    np.testing.assert_array_equal(statistics.max, data.max(axis=axis))
+
+
+@pytest.mark.parametrize('chunk_values', [1, 7, 1024, 1 << 16])
+@pytest.mark.parametrize('n', [1, 2, 1000, 100_003])
+def test_one_pass_matches_numpy_across_chunk_boundaries(monkeypatch, chunk_values, n):
+    monkeypatch.setattr(signal_statistics, 'CHUNK_VALUES', chunk_values)
+    data = np.random.default_rng(n).standard_normal(n) * 5 + 3
+    if n > 1000 and chunk_values == 1:
+        data = data[:5000]   # one value per chunk: keep it quick
+    assert_matches_numpy(SignalStatistics.of(data), data)
+
+
+def test_merged_batches_match_one_pass():
+    data = np.random.default_rng(1).standard_normal(10_000)
+    statistics = SignalStatistics()
+    for size in (1, 0, 13, 986, 9000):
+        start = statistics.count
+        statistics.update(data[start:start + size])
+    assert_matches_numpy(statistics, data)
+
+
+def test_large_offset_keeps_precision():
+    # sum-of-squares formulas lose every digit here, Welford/Chan does not
+    data = 1e9 + np.random.default_rng(2).standard_normal(50_000)
+    assert_matches_numpy(SignalStatistics.of(data), data)
+
+
+def test_channel_major_block_and_channel_slices():
+    data = np.random.default_rng(3).standard_normal((5, 3001)).astype(np.float32)
+    statistics = SignalStatistics.of(data)
+    assert_matches_numpy(statistics, data, axis=1)
+    for index in range(5):
+        assert_matches_numpy(statistics.channel(index), data[index])
+
+
+def test_empty():
+    statistics = SignalStatistics.of(np.empty(0))
+    assert statistics.count == 0 and np.isnan(statistics.variance) and np.isnan(statistics.std)
+    assert statistics.min == np.inf and statistics.max == -np.inf
+    statistics.update([4.0, 2.0])
+    assert_matches_numpy(statistics, [4.0, 2.0])
+
+
+def test_signal_statistics_are_cached_and_follow_appends():
+    data = np.random.default_rng(4).standard_normal(3000)
+    signal = Signal(data[:1000].copy(), f_sample=100)
+    statistics = signal.statistics()
+    assert signal.statistics() is statistics
+    signal.append(data[1000:])
+    assert signal.statistics() is statistics   # updated with only the new samples
+    assert_matches_numpy(statistics, data)
+
+    signal.data = data[:10]
+    assert signal.statistics() is not statistics
+    assert_matches_numpy(signal.statistics(), data[:10])
+
+
+def test_signal_statistics_reset_when_the_ring_drops_samples():
+    data = np.random.default_rng(5).standard_normal(5000)
+    signal = Signal(data[:100].copy(), f_sample=100)
+    signal.retention = 10   # seconds, 1000 samples
+    signal.statistics()
+    for start in range(100, 5000, 250):
+        signal.append(data[start:start + 250])
+        assert_matches_numpy(signal.statistics(), signal.data)
+
+
+def test_channel_block_statistics_follow_appends():
+    rows = np.random.default_rng(6).standard_normal((2000, 3))
+    block = ChannelBlock(rows[:500], 100)
+    signals = block.create_signals(['r', 'g', 'b'])
+    block.statistics()
+    block.append(rows[500:])
+    assert_matches_numpy(block.statistics(), rows.T, axis=1)
+    assert_matches_numpy(signals[2].statistics(), rows[:, 2])
@@ -0,0 +1,19 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('PyQt5')
+
+from utils import Utils
+
+
+def test_curve_is_decimated_for_the_visible_range(app):
+    from statistics_window import StatisticsWindow
+    signal, = Utils.add_signal(app.first_graph, np.sin(np.arange(1_000_000) / 1000), 1000, "long")
+    window = StatisticsWindow(signal.data, signal.title, signal.color, signal)
+    item = window.render_model.curves[id(signal)][1]
+    assert 0 < len(item.xData) < 10_000 and item.xData[-1] > 990   # the whole signal, decimated
+
+    # zoomed in far enough, every sample in view is drawn
+    window.plot_widget.setXRange(100, 100.5, padding=0)
+    x = item.xData
+    assert x[0] <= 100 and x[-1] >= 100.5 and len(x) >= 500
@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('PyQt5')
+
+from stream_protocol import pack_frame
+
+
+def receive(service, samples, sequence):
+    service.streams[0].feed(pack_frame(samples, 100, sequence))
+    service.drain()
+
+
+def test_moved_port_keeps_growing(app):
+    from stream_ingest import StreamIngestService
+    service = StreamIngestService(app.first_graph, [('udp', 5000)])   # fed directly, never started
+    receive(service, np.arange(10, dtype=np.float32), 0)
+    signal = service.streams[0].target
+    assert signal in app.first_graph.signals and len(signal.time_axis) == 10
+
+    app.signal_to_be_moved, app.source_graph = signal, app.first_graph
+    app.move_signal(1)
+    receive(service, np.arange(10, 25, dtype=np.float32), 1)
+    assert signal in app.second_graph.signals and signal not in app.first_graph.signals
+    assert len(signal.time_axis) == 25
+    np.testing.assert_array_equal(signal.data[:], np.arange(25))
+
+
+def test_deleted_port_is_dropped(app):
+    from stream_ingest import StreamIngestService
+    service = StreamIngestService(app.first_graph, [('udp', 5000)])
+    receive(service, np.arange(10, dtype=np.float32), 0)
+    signal = service.streams[0].target
+    app.first_graph.signals.remove(signal)
+    receive(service, np.arange(10, 25, dtype=np.float32), 1)
+    assert len(signal.time_axis) == 10
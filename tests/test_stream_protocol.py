@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+from stream_protocol import FRAME_HEADER, SAMPLE_DTYPE, pack_frame, parse_header, payload_size, unpack_frames
+
+
+def test_frame_round_trip():
+    samples = np.random.default_rng(0).standard_normal((50, 4))
+    frame = pack_frame(samples, 2000.0, 7)
+    assert len(frame) == FRAME_HEADER.size + payload_size(4, 50)
+    [(channels, f_sample, sequence, unpacked)] = list(unpack_frames(frame))
+    assert (channels, f_sample, sequence) == (4, 2000.0, 7)
+    np.testing.assert_array_equal(unpacked, samples.astype(SAMPLE_DTYPE))
+
+
+def test_mono_frame_unpacks_as_one_column():
+    [(channels, _, _, unpacked)] = list(unpack_frames(pack_frame(np.arange(5.0), 100, 0)))
+    assert channels == 1 and unpacked.shape == (5, 1)
+    np.testing.assert_array_equal(unpacked[:, 0], np.arange(5))
+
+
+def test_several_frames_back_to_back():
+    frames = [np.full((n, 2), n, dtype=np.float32) for n in (1, 0, 3)]
+    data = b''.join(pack_frame(samples, 10, sequence) for sequence, samples in enumerate(frames))
+    unpacked = list(unpack_frames(data))
+    assert [sequence for _, _, sequence, _ in unpacked] == [0, 1, 2]
+    for (_, _, _, samples), expected in zip(unpacked, frames):
+        np.testing.assert_array_equal(samples, expected)
+
+
+def test_sequence_wraps_at_32_bits():
+    assert parse_header(pack_frame(np.zeros(1), 10, 2 ** 32 + 5))[2] == 5
+
+
+def test_empty_data_has_no_frames():
+    assert list(unpack_frames(b'')) == []
+
+
+@pytest.mark.parametrize('data', [
+    b'XXXX' + bytes(FRAME_HEADER.size - 4),    # wrong magic
+    b'MSVF',                                   # truncated header
+    pack_frame(np.zeros((4, 2)), 10, 0)[:-1],  # truncated payload
+])
+def test_malformed_frames_raise(data):
+    with pytest.raises(ValueError):
+        list(unpack_frames(data))
+
+
+def test_zero_channels_or_rate_are_rejected():
+    with pytest.raises(ValueError):
+        parse_header(FRAME_HEADER.pack(b'MSVF', 0, 10.0, 0, 0))
+    with pytest.raises(ValueError):
+        parse_header(FRAME_HEADER.pack(b'MSVF', 1, 0.0, 0, 0))
@@ -4,7 +4,13 @@ from pyqtgraph import PlotWidget, QtCore
 import os
 import numpy as np
 import random
-from signal import Signal
+from signal_model import Signal, TimeAxis
+from channel_block import ChannelBlock
+from binary_signal import open_binary_signal
+from signal_importer import SignalImporter
+from csv_ingest import read_rate_csv
+import signal_cache
+import instrumentation
 
 
 class Utils:
@@ -179,21 +185,24 @@ class Utils:
 
     message_box_style_sheet = "QMessageBox { background-color: #042630; color: white; }"
 
+    signal_file_extensions = ('.csv', '.txt', '.bin')
+
   
     @staticmethod
-    def generate_square_wave(points):
-        t = np.linspace(0, points/100, points)
-        return (t < 0.5).astype(int)
+    # single pulse, high for the first `width` seconds
+    def generate_square_wave(points, f_sample=100, width=0.5):
+        t = np.linspace(0, points/f_sample, points)
+        return (t < width).astype(int)
 
     @staticmethod
-    def generate_cosine_wave(points):
-        t = np.linspace(0, points/100, points)
-        return (np.cos(2*np.pi*5*t))
+    def generate_cosine_wave(points, f_sample=100, frequency=5, amplitude=1):
+        t = np.linspace(0, points/f_sample, points)
+        return amplitude * np.cos(2*np.pi*frequency*t)
 
     @staticmethod
-    def generate_sine_wave(points):
-        t = np.linspace(0, points/100, points)
-        return (np.sin(2*np.pi*5*t))
+    def generate_sine_wave(points, f_sample=100, frequency=5, amplitude=1):
+        t = np.linspace(0, points/f_sample, points)
+        return amplitude * np.sin(2*np.pi*frequency*t)
 
     @staticmethod
     def create_button(text, method, icon_name='', stylesheet=button_style_sheet, set_enabled=True):
@@ -278,58 +287,134 @@ class Utils:
         msg_box.exec_()
 
     @staticmethod
-    # browsing local signal files, returning signal data as np array
-    def import_signal_file(plot):
-        file_name, _ = QFileDialog.getOpenFileName()
+    # browsing local signal files, parsing them in the background and adding them to the plot
+    def import_signal_file(plot, file_names=None):
+        if file_names is None:
+            file_names, _ = QFileDialog.getOpenFileNames()
+        if not file_names:
+            return None
+
+        importer = SignalImporter(file_names, Utils.read_signal_file)
+        started = instrumentation.start()
+        importer.done.connect(lambda: instrumentation.stop('import', started))
+        instrumentation.count('import.files', len(file_names))
+        importer.loaded.connect(lambda file_name, signal_data, sampling_rate: Utils.add_signal(
+            plot, signal_data, sampling_rate, os.path.splitext(os.path.basename(file_name))[0], source=file_name))
+        importer.failed.connect(lambda file_name, message: Utils.show_error_message(
+            f"Could not import {os.path.basename(file_name)}: {message}"))
+        return importer.start()
+
+    @staticmethod
+    # scanning a folder tree (e.g. signals_data/ECG) and importing every signal file in it at once
+    def import_signal_folder(plot, folder=None):
+        if folder is None:
+            folder = QFileDialog.getExistingDirectory()
+        if not folder:
+            return None
+
+        file_names = []
+        for root, _, names in os.walk(folder):
+            file_names.extend(os.path.join(root, name) for name in names
+                              if os.path.splitext(name)[1].lower() in Utils.signal_file_extensions)
+        if not file_names:
+            Utils.show_error_message("No signal files found in this folder.")
+            return None
+
+        importer = SignalImporter(sorted(file_names), Utils.read_signal_file, in_process=Utils.needs_parsing)
+        started = instrumentation.start()
+        importer.done.connect(lambda: instrumentation.stop('import_folder', started))
+        instrumentation.count('import.files', len(file_names))
+        importer.loaded_batch.connect(lambda loaded: Utils.add_signals(plot, loaded))
+        importer.failed.connect(lambda file_name, message: Utils.show_error_message(
+            f"Could not import {os.path.basename(file_name)}: {message}"))
+        return importer.start()
+
+    @staticmethod
+    # text files that are not in the signal cache yet; binary and cached files are memory-mapped
+    def needs_parsing(file_name):
+        if os.path.splitext(file_name)[1].lower() == '.bin':
+            return False
+        return not signal_cache.contains(file_name)
+
+    @staticmethod
+    @instrumentation.timed('import.read_file')
+    # parsing a signal file into (signal data as np array, sampling rate); runs on worker threads
+    def read_signal_file(file_name, progress=None, is_cancelled=None, dtype=np.float64):
         sampling_rate = 1
-        if file_name:
-            extension = os.path.splitext(file_name)[1].lower()
-            if extension == '.csv':
-                with open(file_name, mode='r') as file:
-                    # Read the sampling rate from the first line
-                    sampling_rate = float(file.readline().strip())
-
-                    # Load the remaining data into a NumPy array
-                    signal_data = np.genfromtxt(file, delimiter=',')
-
-                # Optionally, you can return or use the sampling rate as needed
-                print("Sampling Rate:", sampling_rate)
-            elif extension == '.txt':
-                # Assuming space-separated signal data in TXT file
-                signal_data = np.loadtxt(file_name)
-            elif extension == '.bin':
-                with open(file_name, 'rb') as f:
-                    # Load binary data assuming it's float32 by default
-                    signal_data = np.fromfile(f, dtype=np.dtype)
-            else:
-                Utils.show_error_message("Unsupported file format.")
-                return
+        extension = os.path.splitext(file_name)[1].lower()
+        if extension in ('.csv', '.txt'):
+            # text files parsed before are memory-mapped from the signal cache instead
+            cached = signal_cache.load(file_name, dtype)
+            if cached is not None:
+                if progress is not None:
+                    progress(100)
+                return cached[0], cached[1]
+
+        if extension == '.csv':
+            # sampling rate on the first line, then samples; parsed in chunks by NumPy's C parser
+            signal_data, sampling_rate = read_rate_csv(
+                file_name, dtype=dtype, progress=progress, is_cancelled=is_cancelled)
+        elif extension == '.txt':
+            # Assuming space-separated signal data in TXT file
+            signal_data = np.loadtxt(file_name)
+        elif extension == '.bin':
+            # memory-mapped, zero-copy: only the pages that get plotted are read from disk
+            signal_data, sampling_rate = open_binary_signal(file_name)
         else:
-            return
+            raise ValueError("Unsupported file format.")
+
+        if extension in ('.csv', '.txt'):
+            signal_cache.store(file_name, signal_data, sampling_rate, dtype)
+
+        if progress is not None:
+            progress(100)
+        return signal_data, sampling_rate
+
+    @staticmethod
+    # adding many parsed files to the plot with a single redraw at the end
+    def add_signals(plot, loaded):
+        for file_name, signal_data, sampling_rate in loaded:
+            Utils.add_signal(plot, signal_data, sampling_rate,
+                             os.path.splitext(os.path.basename(file_name))[0], update=False, source=file_name)
+        plot.update_graph()
+
+    @staticmethod
+    # wrapping parsed data into a Signal on the given plot (GUI thread)
+    def add_signal(plot, signal_data, sampling_rate, title, update=True, source=None):
+        if signal_data.ndim == 2 and signal_data.shape[1] == 1:
+            signal_data = signal_data[:, 0]
 
         if signal_data.ndim == 1:
-            new_signal = Signal(
+            new_signals = [Signal(
                 signal_data=signal_data,
                 color=Utils.generate_random_light_color(),
-                title=os.path.splitext(os.path.basename(file_name))[0],
+                title=title,
                 f_sample=sampling_rate
-            )
-
-            # Append the newly created Signal instance to the signals list
-            plot.signals.append(new_signal)
-            plot.max_length = max(plot.max_length, len(signal_data))
-            print(" Max length: ", plot.max_length)
-            
-            plot.update_max_time(np.linspace(
-                0, plot.max_length / sampling_rate, plot.max_length))
-            print(" Max time: ", plot.max_time_axis)
-            
-
-            plot.plot_signals()
-
+            )]
+        elif signal_data.ndim == 2 and signal_data.shape[1] == 0:
+            Utils.show_error_message(f"{title} has no channels.")
+            return []
+        elif signal_data.ndim == 2:
+            # multi-channel file: one block, one curve per channel
+            block = ChannelBlock(signal_data, sampling_rate, title)
+            new_signals = block.create_signals(
+                Utils.generate_random_light_color() for _ in range(block.n_channels))
+            block.source = source
         else:
             Utils.show_error_message(
                 "Unsupported signal dimension." + str(signal_data.ndim))
+            return []
+
+        for new_signal in new_signals:
+            new_signal.source = source
+
+        # Append the newly created Signal instances to the signals list
+        plot.signals.extend(new_signals)
+        plot.max_length = max(plot.max_length, len(new_signals[0].data))
+        plot.update_max_time(TimeAxis(0, sampling_rate, plot.max_length))
+        if update:
+            plot.update_graph()
+        return new_signals
 
     @staticmethod
     def generate_random_light_color():